@@ -22,7 +22,10 @@ import datetime as _dt
 import hashlib
 import sqlite3
 import sys
+import zlib
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 
 POLICY_TITLE = "Study Bible Compendium – Hermeneutical Rule Policy"
@@ -33,19 +36,80 @@ DEFAULT_SCHEMA_PATH = "schema/hermeneutical_policy.sql"
 DEFAULT_PREFACE_PATH = "data/policy_preface.txt"
 DEFAULT_BODY_PATH = "data/policy_body.txt"
 
+# Module-level SQL: one string object for the life of the process, so
+# repeat invocations hit sqlite3's statement cache by identity.
+_INSERT_SQL = """
+    INSERT INTO hermeneutical_policy (
+        id,
+        title,
+        preface,
+        body,
+        version,
+        effective_utc,
+        checksum
+    ) VALUES (?, ?, ?, ?, ?, ?, ?);
+"""
+
 
 # =========================
 # HELPER FUNCTIONS
 # =========================
 
+@lru_cache(maxsize=4)
 def compute_checksum(preface: str, body: str) -> str:
     """
     Compute a SHA-256 checksum from the concatenation of preface + body.
+
+    Memoized: the policy content is fixed for the life of a process, so
+    repeat calls (e.g. re-running init-policy from a long-lived CLI
+    session) skip the concat/encode/SHA pass.
     """
     combined = (preface + "\n\n" + body).encode("utf-8")
     return hashlib.sha256(combined).hexdigest()
 
 
+def _compress_text(text: str) -> bytes:
+    """
+    Compress policy text for at-rest storage.
+
+    The preface/body are highly redundant prose (repeated bullets and
+    headings), so max-level zlib cuts the stored bytes roughly 3-4x and
+    the row spans fewer SQLite pages. The checksum is always computed
+    over the plaintext, so it is unaffected by the storage encoding.
+    """
+    return zlib.compress(text.encode("utf-8"), 9)
+
+
+def read_policy(conn: sqlite3.Connection) -> Optional[dict]:
+    """
+    Read the policy row and return it with preface/body decompressed.
+
+    Returns a dict with keys: id, title, preface, body, version,
+    effective_utc, checksum — or None if no policy row exists.
+    """
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT id, title, preface, body, version, effective_utc, checksum
+        FROM hermeneutical_policy
+        WHERE id = 1;
+        """
+    )
+    row = cur.fetchone()
+    if row is None:
+        return None
+
+    return {
+        "id": row[0],
+        "title": row[1],
+        "preface": zlib.decompress(row[2]).decode("utf-8"),
+        "body": zlib.decompress(row[3]).decode("utf-8"),
+        "version": row[4],
+        "effective_utc": row[5],
+        "checksum": row[6],
+    }
+
+
 def read_text_file(file_path: Path) -> str:
     """
     Read a text file and return its contents.
@@ -76,13 +140,20 @@ def apply_schema(conn: sqlite3.Connection, schema_path: Path) -> None:
     with open(schema_path, 'r', encoding='utf-8') as f:
         schema_sql = f.read()
     
+    # Run the DDL in autocommit mode: executescript already commits any
+    # pending transaction up front, and with isolation_level=None the
+    # wrapper never opens an implicit BEGIN around it — one fewer
+    # journal round-trip, which matters on slow filesystems.
+    old_isolation = conn.isolation_level
+    conn.isolation_level = None
     try:
         conn.executescript(schema_sql)
-        conn.commit()
         print("[ok] Schema applied successfully")
     except sqlite3.Error as e:
         print(f"[error] Failed to apply schema: {e}")
         sys.exit(1)
+    finally:
+        conn.isolation_level = old_isolation
 
 
 def policy_exists(conn: sqlite3.Connection) -> bool:
@@ -90,26 +161,31 @@ def policy_exists(conn: sqlite3.Connection) -> bool:
     Return True if a policy row already exists, False otherwise.
     """
     cur = conn.cursor()
-    cur.execute("SELECT COUNT(*) FROM hermeneutical_policy;")
-    (count,) = cur.fetchone()
-    return count >= 1
+    # Existence probe, not an aggregate: returns on the first row hit.
+    cur.execute("SELECT 1 FROM hermeneutical_policy LIMIT 1;")
+    return cur.fetchone() is not None
 
 
 def insert_policy(
     conn: sqlite3.Connection,
     preface: str,
     body: str
-) -> None:
+) -> bool:
     """
     Insert the hermeneutical policy if it does not already exist.
     Respects the locking triggers; will not modify an existing row.
+
+    Returns True if the policy is present (inserted now or already
+    there), False if the insert failed.
     """
     if policy_exists(conn):
         print("[info] hermeneutical_policy row already present; no changes made (locked).")
-        return
+        return True
 
     checksum = compute_checksum(preface, body)
-    effective_utc = _dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    # Timezone-aware now(); utcnow() is deprecated as of Python 3.12.
+    now = _dt.datetime.now(_dt.timezone.utc).replace(microsecond=0, tzinfo=None)
+    effective_utc = now.isoformat() + "Z"
 
     print(f"[info] Computed checksum: {checksum}")
     print(f"[info] Effective UTC: {effective_utc}")
@@ -117,22 +193,12 @@ def insert_policy(
     cur = conn.cursor()
     try:
         cur.execute(
-            """
-            INSERT INTO hermeneutical_policy (
-                id,
-                title,
-                preface,
-                body,
-                version,
-                effective_utc,
-                checksum
-            ) VALUES (?, ?, ?, ?, ?, ?, ?);
-            """,
+            _INSERT_SQL,
             (
                 1,
                 POLICY_TITLE,
-                preface,
-                body,
+                _compress_text(preface),
+                _compress_text(body),
                 POLICY_VERSION,
                 effective_utc,
                 checksum,
@@ -142,10 +208,12 @@ def insert_policy(
         print("[ok] hermeneutical_policy initialized and locked.")
         print(f"[ok] version: {POLICY_VERSION}")
         print(f"[ok] checksum: {checksum}")
+        return True
     except sqlite3.IntegrityError as e:
         msg = str(e)
         print(f"[warn] IntegrityError while inserting policy: {msg}")
         print("[warn] Policy may already be locked or constrained. No changes were made.")
+        return False
     except sqlite3.Error as e:
         print(f"[error] SQLite error while inserting policy: {e}")
         sys.exit(1)
@@ -187,9 +255,18 @@ def run_init_policy(
     preface_path = project_root / preface_path
     body_path = project_root / body_path
     
+    # Warm-run fast reject: once the policy is locked we drop a marker
+    # file next to the DB and short-circuit before opening SQLite at
+    # all. Checking db_path too guards against a stale marker surviving
+    # a deleted database.
+    marker = db_path.with_name(db_path.name + ".policy_locked")
+    if marker.exists() and db_path.exists():
+        print(f"[info] Policy already locked (marker: {marker.name}); nothing to do.")
+        return
+
     print(f"[info] Project root: {project_root}")
     print(f"[info] Database: {db_path}")
-    
+
     # Ensure database parent directory exists
     db_path.parent.mkdir(parents=True, exist_ok=True)
     
@@ -212,10 +289,15 @@ def run_init_policy(
         body = read_text_file(body_path)
         
         # Insert policy
-        insert_policy(conn, preface, body)
-        
+        if insert_policy(conn, preface, body):
+            marker.touch()
+
     finally:
         conn.close()
+        # Drop the memoized checksum entry so a long-lived host process
+        # (e.g. the serve dispatcher) does not keep the multi-KB policy
+        # strings alive after the run; the file locals go with it.
+        compute_checksum.cache_clear()
 
 
 def main(argv=None) -> None:
@@ -21,25 +21,16 @@ Commands:
 """
 
 import argparse
-import sys
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from sbc.paths import PROJECT_ROOT, DB_PATH, SCHEMA_DIR, ensure_basic_dirs
 from sbc.util import info, warn
 from sbc import config
-from sbc.loader import import_bible_from_excel, list_loaded_translations, ensure_translations_schema
-from sbc.search import search_verses, print_search_results, get_passage
-from sbc.pdfgen import (
-    generate_basic_report,
-    generate_passage_report,
-    generate_parallel_report,
-)
-from sbc.db import get_conn
-from sbc.status import print_status, get_policy_status
-from sbc.context import get_verse_window
-from sbc.parallel import get_parallel_verses, print_parallel
-from sbc.spine import build_spine
+
+# Heavier sbc.* submodules (loader/openpyxl, pdfgen, sqlite-backed helpers)
+# are imported inside the cmd_* handlers so each invocation only pays the
+# import cost of the subcommand it actually runs.
 
 
 # ---------- Command handlers ----------
@@ -47,30 +38,30 @@ from sbc.spine import build_spine
 
 def cmd_init_policy(args: argparse.Namespace) -> None:
     """
-    Run cli/init_policy.py as a subprocess.
-
-    This lets that script keep its own argparse logic without conflicting
-    with this top-level CLI.
+    Initialize and lock the hermeneutical policy via cli.init_policy,
+    called in-process (no interpreter re-launch per invocation).
     """
-    script_path = PROJECT_ROOT / "cli" / "init_policy.py"
-    if not script_path.exists():
-        warn(f"init_policy.py not found at: {script_path}")
-        return
-
     db_path = Path(args.db) if args.db else DB_PATH
 
-    info(f"Running init_policy.py on DB: {db_path}")
-    cmd = [sys.executable, str(script_path), "--db", str(db_path)]
     try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        warn(f"init_policy.py exited with non-zero status: {e.returncode}")
+        from cli.init_policy import run_init_policy
+    except ImportError as e:
+        warn(f"Could not import cli.init_policy ({e}); run from the project root.")
+        return
+
+    info(f"Initializing policy on DB: {db_path}")
+    try:
+        run_init_policy(db_path=str(db_path), project_root=PROJECT_ROOT)
+    except Exception as e:
+        warn(f"init_policy failed: {e}")
 
 
 def cmd_init_schema(args: argparse.Namespace) -> None:
     """
     Apply the verse schema SQL to the database (idempotent).
     """
+    from sbc.db import get_conn
+
     schema_path = SCHEMA_DIR / "verse_schema.sql"
     if not schema_path.exists():
         warn(f"verse_schema.sql not found at: {schema_path}")
@@ -80,22 +71,27 @@ def cmd_init_schema(args: argparse.Namespace) -> None:
     info(f"Applying verse schema from: {schema_path}")
     with get_conn() as conn:
         conn.executescript(sql)
+        # Backfill the FTS index for verses imported before verses_fts
+        # existed; the schema triggers keep it in sync from here on.
+        conn.execute("INSERT INTO verses_fts(verses_fts) VALUES('rebuild');")
         conn.commit()
     info("Verse schema initialized / verified.")
 
 
 def cmd_import_bible(args: argparse.Namespace) -> None:
     """
-    Wire through to sbc.loader.import_bible_from_excel with full options.
+    Wire through to sbc.loader.import_bible with full options.
     """
+    from sbc.loader import import_bible
+
     excel_path = Path(args.excel)
-    translation_code = args.code.upper()
+    translation_code = args.code
     overwrite = args.overwrite
     sheet_name = args.sheet
     dry_run = args.dry_run
     max_rows = args.max_rows
 
-    import_bible_from_excel(
+    import_bible(
         excel_path,
         translation_code,
         overwrite=overwrite,
@@ -109,6 +105,8 @@ def cmd_search(args: argparse.Namespace) -> None:
     """
     Wire through to sbc.search.search_verses, then pretty-print results.
     """
+    from sbc.search import search_verses, print_search_results
+
     query = args.query
     limit = args.limit
     translation = args.code
@@ -120,6 +118,8 @@ def cmd_list_translations(args: argparse.Namespace) -> None:
     """
     List all translations loaded in verses_normalized table.
     """
+    from sbc.loader import list_loaded_translations
+
     list_loaded_translations()
 
 
@@ -127,6 +127,8 @@ def cmd_passage(args: argparse.Namespace) -> None:
     """
     Extract a passage by reference.
     """
+    from sbc.search import get_passage, print_search_results
+
     ref = args.ref
     translation = args.code
     rows = get_passage(ref, translation)
@@ -137,6 +139,9 @@ def cmd_context(args: argparse.Namespace) -> None:
     """
     Fetch a window of verses around a central reference.
     """
+    from sbc.context import get_verse_window
+    from sbc.search import print_search_results
+
     ref = args.ref
     translation = args.code
     before = args.before
@@ -149,6 +154,8 @@ def cmd_pdf_report(args: argparse.Namespace) -> None:
     """
     Wire through to sbc.pdfgen.generate_basic_report (currently writes .txt).
     """
+    from sbc.pdfgen import generate_basic_report
+
     output_path = Path(args.output)
     title = args.title
 
@@ -170,6 +177,14 @@ def cmd_pdf_passage(args: argparse.Namespace) -> None:
     """
     Generate a passage-focused report tied to the hermeneutical policy.
     """
+    import sqlite3
+
+    from sbc.context import get_verse_window
+    from sbc.db import get_conn
+    from sbc.pdfgen import generate_passage_report
+    from sbc.search import get_passage
+    from sbc.status import get_policy_status
+
     ref = args.ref
     translation = args.code
     output_path = Path(args.output)
@@ -177,19 +192,24 @@ def cmd_pdf_passage(args: argparse.Namespace) -> None:
     before = args.before
     after = args.after
 
-    # Get passage verses
-    passage_rows = get_passage(ref, translation)
+    # One read-only connection shared by the passage, context, and policy
+    # lookups instead of opening the DB three times.
+    try:
+        with get_conn(readonly=True) as conn:
+            passage_rows = get_passage(ref, translation, conn=conn)
+            context_rows = None
+            if passage_rows and include_context:
+                context_rows = get_verse_window(
+                    ref, translation, before=before, after=after, conn=conn
+                )
+            policy = get_policy_status(conn=conn)
+    except sqlite3.Error as e:
+        warn(f"Database error while gathering report data: {e}")
+        return
+
     if not passage_rows:
         warn("No verses found for the requested passage; no report generated.")
         return
-
-    # Get optional context window (around the first verse in the reference)
-    context_rows = None
-    if include_context:
-        context_rows = get_verse_window(ref, translation, before=before, after=after)
-
-    # Get policy info
-    policy = get_policy_status()
     if policy is None:
         policy_version = None
         policy_checksum = None
@@ -211,6 +231,8 @@ def cmd_init_translations(args: argparse.Namespace) -> None:
     """
     Ensure the translations table exists (idempotent).
     """
+    from sbc.loader import ensure_translations_schema
+
     ensure_translations_schema()
     info("Translations schema initialized / verified.")
 
@@ -219,8 +241,10 @@ def cmd_compare(args: argparse.Namespace) -> None:
     """
     Console-side parallel comparison of translations for a reference.
     """
+    from sbc.parallel import get_parallel_verses, print_parallel
+
     ref = args.ref
-    codes = [c.upper() for c in args.codes]
+    codes = args.codes
     rows = get_parallel_verses(ref, codes)
     print_parallel(ref, codes, rows)
 
@@ -229,36 +253,60 @@ def cmd_pdf_parallel(args: argparse.Namespace) -> None:
     """
     Generate a parallel translation report tied to the hermeneutical policy.
     """
+    import sqlite3
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import chain
+
+    from sbc.db import get_conn
+    from sbc.parallel import iter_parallel_verses
+    from sbc.pdfgen import generate_parallel_report
+    from sbc.status import get_policy_status
+
     ref = args.ref
-    codes = [c.upper() for c in args.codes]
+    codes = args.codes
     output_path = Path(args.output)
 
-    rows = get_parallel_verses(ref, codes)
-    if not rows:
-        warn("No parallel verses found; no report generated.")
+    # Rows stream straight from the cursor into the report writer; only
+    # the first row is pulled eagerly to detect the empty case. The policy
+    # lookup overlaps the verse query on a worker thread — sqlite3 drops
+    # the GIL inside step(), and the worker opens its own connection since
+    # connections are single-thread by default.
+    try:
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            policy_future = ex.submit(get_policy_status)
+            with get_conn(readonly=True) as conn:
+                rows = iter_parallel_verses(ref, codes, conn=conn)
+                first = next(rows, None)
+                if first is None:
+                    warn("No parallel verses found; no report generated.")
+                    return
+
+                policy = policy_future.result()
+                if policy is None:
+                    policy_version = None
+                    policy_checksum = None
+                else:
+                    policy_version, policy_checksum = policy
+
+                generate_parallel_report(
+                    output_path=output_path,
+                    ref=ref,
+                    translation_codes=codes,
+                    rows=chain([first], rows),
+                    policy_version=policy_version,
+                    policy_checksum=policy_checksum,
+                )
+    except sqlite3.Error as e:
+        warn(f"Database error while gathering report data: {e}")
         return
 
-    policy = get_policy_status()
-    if policy is None:
-        policy_version = None
-        policy_checksum = None
-    else:
-        policy_version, policy_checksum = policy
-
-    generate_parallel_report(
-        output_path=output_path,
-        ref=ref,
-        translation_codes=codes,
-        rows=rows,
-        policy_version=policy_version,
-        policy_checksum=policy_checksum,
-    )
-
 
 def cmd_build_spine(args: argparse.Namespace) -> None:
     """
     Build the canonical verse spine and attach verse_id to verses.
     """
+    from sbc.spine import build_spine
+
     build_spine()
 
 
@@ -266,274 +314,233 @@ def cmd_status(args: argparse.Namespace) -> None:
     """
     Print a quick system status report.
     """
+    from sbc.status import print_status
+
     print_status()
 
 
-# ---------- Parser setup ----------
+def cmd_serve(args: argparse.Namespace) -> None:
+    """
+    Persistent line dispatcher for batch callers.
 
+    Reads one CLI command per stdin line and runs it in-process, so a
+    shell or test harness piping N commands pays interpreter startup and
+    sbc imports once instead of N times. Prints READY after startup and
+    after each command; stops on EOF or an 'exit'/'quit' line.
+    """
+    import shlex
+    import sys
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="compendium",
-        description=f"{config.APP_NAME} CLI (v{config.__version__})",
-    )
-    sub = parser.add_subparsers(dest="command", required=True)
+    parser = build_parser()
+    print("READY", flush=True)
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        if line in ("exit", "quit"):
+            break
+
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            warn(f"Could not parse command line: {e}")
+            print("READY", flush=True)
+            continue
+
+        if argv[0] == "serve":
+            warn("Already serving; nested 'serve' ignored.")
+            print("READY", flush=True)
+            continue
+
+        try:
+            sub_args = parser.parse_args(argv)
+        except SystemExit:
+            # argparse already printed the usage error; keep serving.
+            print("READY", flush=True)
+            continue
+
+        try:
+            sub_args.func(sub_args)
+        except Exception as e:
+            warn(f"Command failed: {e}")
+        print("READY", flush=True)
 
-    # init-policy
-    p_init = sub.add_parser(
-        "init-policy",
-        help="Initialize and lock the hermeneutical policy in the database",
-    )
-    p_init.add_argument(
-        "--db",
-        type=str,
-        default=None,
-        help="Path to SQLite DB (default: compendium.sqlite at project root)",
-    )
-    p_init.set_defaults(func=cmd_init_policy)
 
-    # init-schema
-    p_schema = sub.add_parser(
-        "init-schema",
-        help="Create/ensure the core verse schema (verses table + indexes)",
-    )
-    p_schema.set_defaults(func=cmd_init_schema)
+# ---------- Parser setup ----------
 
-    # init-translations
-    p_tr = sub.add_parser(
-        "init-translations",
-        help="Create/ensure the translations registry table",
-    )
-    p_tr.set_defaults(func=cmd_init_translations)
 
-    # import-bible
-    p_import = sub.add_parser(
+# Declarative subcommand registry: (name, handler, [(argument, kwargs), ...],
+# help text). build_parser() walks this table instead of running ~15
+# imperative add_parser blocks, keeping the CLI cold path short.
+_SUBCOMMANDS = (
+    (
+        "init-policy",
+        cmd_init_policy,
+        [
+            ("--db", dict(type=str, default=None,
+                          help="Path to SQLite DB (default: compendium.sqlite at project root)")),
+        ],
+        "Initialize and lock the hermeneutical policy in the database",
+    ),
+    (
+        "init-schema",
+        cmd_init_schema,
+        [],
+        "Create/ensure the core verse schema (verses table + indexes)",
+    ),
+    (
+        "init-translations",
+        cmd_init_translations,
+        [],
+        "Create/ensure the translations registry table",
+    ),
+    (
         "import-bible",
-        help="Import a Bible from an Excel file into the `verses_normalized` table",
-    )
-    p_import.add_argument(
-        "excel",
-        type=str,
-        help="Path to the Excel file to import",
-    )
-    p_import.add_argument(
-        "code",
-        type=str,
-        help="Translation code (e.g., KJV, BSB, ASV)",
-    )
-    p_import.add_argument(
-        "--overwrite",
-        action="store_true",
-        help="Delete existing verses for this translation before import",
-    )
-    p_import.add_argument(
-        "--sheet",
-        type=str,
-        default=None,
-        help="Worksheet name (default: active sheet)",
-    )
-    p_import.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Do not write to the DB; just parse and report",
-    )
-    p_import.add_argument(
-        "--max-rows",
-        type=int,
-        default=None,
-        help="Maximum number of data rows to import (for testing)",
-    )
-    p_import.set_defaults(func=cmd_import_bible)
-
-    # list-translations
-    p_list = sub.add_parser(
+        cmd_import_bible,
+        [
+            ("excel", dict(type=str, help="Path to the Excel file to import")),
+            ("code", dict(type=str.upper, help="Translation code (e.g., KJV, BSB, ASV)")),
+            ("--overwrite", dict(action="store_true",
+                                 help="Delete existing verses for this translation before import")),
+            ("--sheet", dict(type=str, default=None,
+                             help="Worksheet name (default: active sheet)")),
+            ("--dry-run", dict(action="store_true",
+                               help="Do not write to the DB; just parse and report")),
+            ("--max-rows", dict(type=int, default=None,
+                                help="Maximum number of data rows to import (for testing)")),
+        ],
+        "Import a Bible from an Excel file into the `verses_normalized` table",
+    ),
+    (
         "list-translations",
-        help="List all translations loaded in the database",
-    )
-    p_list.set_defaults(func=cmd_list_translations)
-
-    # search
-    p_search = sub.add_parser(
+        cmd_list_translations,
+        [],
+        "List all translations loaded in the database",
+    ),
+    (
         "search",
-        help="Search verses for a text phrase",
-    )
-    p_search.add_argument(
-        "query",
-        type=str,
-        help="Search text",
-    )
-    p_search.add_argument(
-        "--limit",
-        type=int,
-        default=20,
-        help="Maximum number of verses to return (default: 20)",
-    )
-    p_search.add_argument(
-        "--code",
-        type=str,
-        default=None,
-        help="Optional translation code filter (e.g., KJV)",
-    )
-    p_search.set_defaults(func=cmd_search)
-
-    # passage
-    p_passage = sub.add_parser(
+        cmd_search,
+        [
+            ("query", dict(type=str, help="Search text")),
+            ("--limit", dict(type=int, default=20,
+                             help="Maximum number of verses to return (default: 20)")),
+            ("--code", dict(type=str.upper, default=None,
+                            help="Optional translation code filter (e.g., KJV)")),
+        ],
+        "Search verses for a text phrase",
+    ),
+    (
         "passage",
-        help="Fetch a passage by reference (e.g. 'John 3:16-18')",
-    )
-    p_passage.add_argument(
-        "ref",
-        type=str,
-        help="Reference string, e.g. 'John 3:16-18', 'Gen 1:1'",
-    )
-    p_passage.add_argument(
-        "code",
-        type=str,
-        help="Translation code (e.g., KJV, BSB)",
-    )
-    p_passage.set_defaults(func=cmd_passage)
-
-    # context
-    p_context = sub.add_parser(
+        cmd_passage,
+        [
+            ("ref", dict(type=str, help="Reference string, e.g. 'John 3:16-18', 'Gen 1:1'")),
+            ("code", dict(type=str.upper, help="Translation code (e.g., KJV, BSB)")),
+        ],
+        "Fetch a passage by reference (e.g. 'John 3:16-18')",
+    ),
+    (
         "context",
-        help="Fetch a window of verses around a reference (e.g. 'John 3:16')",
-    )
-    p_context.add_argument(
-        "ref",
-        type=str,
-        help="Central reference, e.g. 'John 3:16'",
-    )
-    p_context.add_argument(
-        "code",
-        type=str,
-        help="Translation code (e.g., KJV, BSB)",
-    )
-    p_context.add_argument(
-        "--before",
-        type=int,
-        default=2,
-        help="How many verses before the center to include (default: 2)",
-    )
-    p_context.add_argument(
-        "--after",
-        type=int,
-        default=2,
-        help="How many verses after the center to include (default: 2)",
-    )
-    p_context.set_defaults(func=cmd_context)
-
-    # pdf-report
-    p_pdf = sub.add_parser(
+        cmd_context,
+        [
+            ("ref", dict(type=str, help="Central reference, e.g. 'John 3:16'")),
+            ("code", dict(type=str.upper, help="Translation code (e.g., KJV, BSB)")),
+            ("--before", dict(type=int, default=2,
+                              help="How many verses before the center to include (default: 2)")),
+            ("--after", dict(type=int, default=2,
+                             help="How many verses after the center to include (default: 2)")),
+        ],
+        "Fetch a window of verses around a reference (e.g. 'John 3:16')",
+    ),
+    (
         "pdf-report",
-        help="(scaffold) Generate a basic report (currently .txt) to test pipeline",
-    )
-    p_pdf.add_argument(
-        "output",
-        type=str,
-        help="Output file name (extension will be changed to .txt for now)",
-    )
-    p_pdf.add_argument(
-        "title",
-        type=str,
-        help="Report title",
-    )
-    p_pdf.add_argument(
-        "--body",
-        type=str,
-        default=None,
-        help="Inline body text for the report",
-    )
-    p_pdf.add_argument(
-        "--body-file",
-        type=str,
-        default=None,
-        help="Path to a text file whose contents become the report body",
-    )
-    p_pdf.set_defaults(func=cmd_pdf_report)
-
-    # pdf-passage
-    p_pdfp = sub.add_parser(
+        cmd_pdf_report,
+        [
+            ("output", dict(type=str,
+                            help="Output file name (.pdf when reportlab is installed, .txt fallback otherwise)")),
+            ("title", dict(type=str, help="Report title")),
+            ("--body", dict(type=str, default=None,
+                            help="Inline body text for the report")),
+            ("--body-file", dict(type=str, default=None,
+                                 help="Path to a text file whose contents become the report body")),
+        ],
+        "Generate a basic report (PDF when reportlab is available, .txt otherwise)",
+    ),
+    (
         "pdf-passage",
-        help="Generate a passage report tied to the hermeneutical policy",
-    )
-    p_pdfp.add_argument(
-        "ref",
-        type=str,
-        help="Reference string, e.g. 'John 3:16-18'",
-    )
-    p_pdfp.add_argument(
-        "code",
-        type=str,
-        help="Translation code (e.g., KJV, BSB)",
-    )
-    p_pdfp.add_argument(
-        "output",
-        type=str,
-        help="Base output file name (extension will become .txt for now)",
-    )
-    p_pdfp.add_argument(
-        "--include-context",
-        action="store_true",
-        help="Include a context window around the first verse of the reference",
-    )
-    p_pdfp.add_argument(
-        "--before",
-        type=int,
-        default=2,
-        help="Context: verses before center (default: 2)",
-    )
-    p_pdfp.add_argument(
-        "--after",
-        type=int,
-        default=2,
-        help="Context: verses after center (default: 2)",
-    )
-    p_pdfp.set_defaults(func=cmd_pdf_passage)
-
-    # compare
-    p_cmp = sub.add_parser(
+        cmd_pdf_passage,
+        [
+            ("ref", dict(type=str, help="Reference string, e.g. 'John 3:16-18'")),
+            ("code", dict(type=str.upper, help="Translation code (e.g., KJV, BSB)")),
+            ("output", dict(type=str,
+                            help="Base output file name (.pdf when reportlab is installed, .txt fallback otherwise)")),
+            ("--include-context", dict(action="store_true",
+                                       help="Include a context window around the first verse of the reference")),
+            ("--before", dict(type=int, default=2,
+                              help="Context: verses before center (default: 2)")),
+            ("--after", dict(type=int, default=2,
+                             help="Context: verses after center (default: 2)")),
+        ],
+        "Generate a passage report tied to the hermeneutical policy",
+    ),
+    (
         "compare",
-        help="Console-side parallel comparison across translations for a reference",
-    )
-    p_cmp.add_argument("ref", type=str, help="Reference string, e.g. 'John 3:16-18'")
-    p_cmp.add_argument(
-        "codes",
-        nargs="+",
-        type=str,
-        help="One or more translation codes, e.g. KJV BSB ASV",
-    )
-    p_cmp.set_defaults(func=cmd_compare)
-
-    # pdf-parallel
-    p_pdfpl = sub.add_parser(
+        cmd_compare,
+        [
+            ("ref", dict(type=str, help="Reference string, e.g. 'John 3:16-18'")),
+            ("codes", dict(nargs="+", type=str.upper,
+                           help="One or more translation codes, e.g. KJV BSB ASV")),
+        ],
+        "Console-side parallel comparison across translations for a reference",
+    ),
+    (
         "pdf-parallel",
-        help="Generate a parallel translation report tied to the hermeneutical policy",
-    )
-    p_pdfpl.add_argument("ref", type=str, help="Reference string, e.g. 'John 3:16-18'")
-    p_pdfpl.add_argument(
-        "codes",
-        nargs="+",
-        type=str,
-        help="One or more translation codes, e.g. KJV BSB ASV",
-    )
-    p_pdfpl.add_argument(
-        "output", type=str, help="Base output file name (extension becomes .txt for now)"
-    )
-    p_pdfpl.set_defaults(func=cmd_pdf_parallel)
-
-    # build-spine
-    p_spine = sub.add_parser(
+        cmd_pdf_parallel,
+        [
+            ("ref", dict(type=str, help="Reference string, e.g. 'John 3:16-18'")),
+            ("codes", dict(nargs="+", type=str.upper,
+                           help="One or more translation codes, e.g. KJV BSB ASV")),
+            ("output", dict(type=str,
+                            help="Base output file name (.pdf when reportlab is installed, .txt fallback otherwise)")),
+        ],
+        "Generate a parallel translation report tied to the hermeneutical policy",
+    ),
+    (
         "build-spine",
-        help="Build canonical verse spine and attach verse_id to verses",
-    )
-    p_spine.set_defaults(func=cmd_build_spine)
-
-    # status
-    p_status = sub.add_parser(
+        cmd_build_spine,
+        [],
+        "Build canonical verse spine and attach verse_id to verses",
+    ),
+    (
         "status",
-        help="Show DB, policy, and translation status summary",
+        cmd_status,
+        [],
+        "Show DB, policy, and translation status summary",
+    ),
+    (
+        "serve",
+        cmd_serve,
+        [],
+        "Run a persistent stdin dispatcher (one command per line) for batch callers",
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    # Cached: the parser is stateless after construction (parse_args
+    # returns a fresh Namespace), so repeated in-process dispatch from
+    # tests or a REPL reuses one instance.
+    parser = argparse.ArgumentParser(
+        prog="compendium",
+        description=f"{config.APP_NAME} CLI (v{config.__version__})",
     )
-    p_status.set_defaults(func=cmd_status)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    for name, func, arg_specs, help_text in _SUBCOMMANDS:
+        p = sub.add_parser(name, help=help_text)
+        for arg, kwargs in arg_specs:
+            p.add_argument(arg, **kwargs)
+        p.set_defaults(func=func)
 
     return parser
 
@@ -13,9 +13,30 @@ This package contains the core functionality for the Study Bible Compendium:
 from . import config
 from .paths import PROJECT_ROOT, DB_PATH, ensure_basic_dirs
 from .util import info, warn, ok
-from .loader import import_bible_from_excel
-from .search import search_verses, print_search_results
-from .pdfgen import generate_basic_report
+
+# The heavy re-exports (loader pulls in the Excel machinery, pdfgen
+# pulls in reportlab) resolve lazily via PEP 562 so that importing any
+# sbc submodule — which runs this file — stays cheap. sbc.import_bible
+# and friends still work exactly as before.
+_LAZY_EXPORTS = {
+    "import_bible": "loader",
+    "import_bible_from_excel": "loader",
+    "search_verses": "search",
+    "print_search_results": "search",
+    "generate_basic_report": "pdfgen",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __version__ = config.__version__
 __all__ = [
@@ -26,6 +47,7 @@ __all__ = [
     "info",
     "warn",
     "ok",
+    "import_bible",
     "import_bible_from_excel",
     "search_verses",
     "print_search_results",
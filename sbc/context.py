@@ -7,6 +7,8 @@ so you can see verses before and after a given location.
 Public API:
 
 - get_verse_window(ref, translation_code, before=2, after=2) -> List[VerseRow]
+- get_verse_windows(refs, translation_code, before=2, after=2)
+    -> Dict[ref, List[VerseRow]] (batched: one chapter fetch per chapter)
 
 Where VerseRow is:
     (translation_code, book_num, book_code, chapter, verse, text)
@@ -15,9 +17,12 @@ Where VerseRow is:
 from __future__ import annotations
 
 from typing import List, Tuple, Optional, Dict, Any
+import re
 import sqlite3
+import sys
+import threading
 
-from .db import get_conn
+from .paths import DB_PATH
 from .util import info, warn
 from .loader import load_canon
 
@@ -26,23 +31,63 @@ from .loader import load_canon
 VerseRow = Tuple[str, int, str, int, int, str]
 
 
+# Compiled once at import; parsing a reference is then a single match
+# instead of an rindex/split chain re-run on every call.
+_REF_RE = re.compile(r"^\s*(?P<book>.+?)\s+(?P<chapter>\d+)\s*:\s*(?P<verse>\d+)\s*$")
+
+
+_local = threading.local()
+
+
+def _cached_readonly_conn() -> sqlite3.Connection:
+    """
+    Per-thread cached read-only connection for context queries.
+
+    Repeated window lookups previously opened (and closed) a fresh
+    connection each call; caching one per thread skips the VFS open and
+    PRAGMA setup. query_only hard-enforces read-only use, and mmap lets
+    verse reads come straight from the OS page cache. The connection
+    lives for the rest of the process.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True, cached_statements=512)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(
+            """
+            PRAGMA query_only=1;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            """
+        )
+        _local.conn = conn
+    return conn
+
+
+# canon.json is immutable at runtime, so the book lookup is built once
+# per process instead of per call.
+_book_lookup_cache: Optional[Dict[str, int]] = None
+
+
 def _build_book_lookup(canon: Dict[int, Dict[str, Any]]) -> Dict[str, int]:
     """
-    Build a mapping from various book strings to book_num.
+    Build a mapping from book strings to book_num.
 
-    Keys include:
-    - 3-letter code (GEN)
-    - full name (Genesis)
-    - lowercase variants
+    Keys are the casefolded 3-letter code (gen) and full name (genesis);
+    callers probe once with book_str.casefold() instead of trying exact
+    and lowercase variants. The result is cached for the life of the
+    process.
     """
+    global _book_lookup_cache
+    if _book_lookup_cache is not None:
+        return _book_lookup_cache
+
     lookup: Dict[str, int] = {}
     for num, meta in canon.items():
-        code = meta["code"]
-        name = meta["name"]
-
-        for key in {code, code.lower(), name, name.lower()}:
-            lookup[key] = num
+        lookup[meta["code"].casefold()] = num
+        lookup[meta["name"].casefold()] = num
 
+    _book_lookup_cache = lookup
     return lookup
 
 
@@ -55,34 +100,63 @@ def _parse_reference(ref: str) -> Optional[tuple[str, int, int]]:
     This is intentionally simpler than the passage parser: we only
     need a single verse as the center-point of the context window.
     """
-    s = ref.strip()
-    if not s:
+    if not ref.strip():
         warn("Empty reference string.")
         return None
 
-    try:
-        space_idx = s.rindex(" ")
-    except ValueError:
-        warn(f"Could not split book and chapter/verse from reference: {ref!r}")
+    m = _REF_RE.match(ref)
+    if m is None:
+        warn(f"Could not parse reference (expected 'Book C:V'): {ref!r}")
         return None
 
-    book_str = s[:space_idx].strip()
-    cv_str = s[space_idx + 1 :].strip()
+    return m.group("book"), int(m.group("chapter")), int(m.group("verse"))
 
-    if ":" not in cv_str:
-        warn(f"Reference missing ':' in chapter:verse part: {ref!r}")
-        return None
 
-    chap_str, verse_str = cv_str.split(":", 1)
+def _get_verse_window_fast(
+    translation_code: str,
+    book_num: int,
+    chapter: int,
+    center_verse: int,
+    before: int = 2,
+    after: int = 2,
+    conn: Optional[sqlite3.Connection] = None,
+) -> List[VerseRow]:
+    """
+    Core window fetch for callers holding canonical inputs.
 
-    try:
-        chapter = int(chap_str.strip())
-        verse = int(verse_str.strip())
-    except ValueError:
-        warn(f"Invalid chapter/verse in reference: {ref!r}")
-        return None
+    Assumes translation_code is already upper-case and the book is
+    already resolved to book_num, so tight loops skip the reference
+    parse, canon lookup, and str.upper() per call.
+    """
+    v_start = max(1, center_verse - before)
+    v_end = center_verse + after
 
-    return book_str, chapter, verse
+    try:
+        active = conn if conn is not None else _cached_readonly_conn()
+        cur = active.execute(
+            """
+            SELECT translation_code,
+                   book_num,
+                   book_code,
+                   chapter,
+                   verse,
+                   text
+            FROM verses_normalized
+            WHERE translation_code = ?
+              AND book_num = ?
+              AND chapter = ?
+              AND verse BETWEEN ? AND ?
+            ORDER BY verse;
+            """,
+            (translation_code, book_num, chapter, v_start, v_end),
+        )
+        # Plain tuples straight from the C layer — already the VerseRow
+        # shape, so no per-row rebuild is needed.
+        cur.row_factory = None
+        return cur.fetchall()
+    except sqlite3.Error as e:
+        warn(f"Database error during context retrieval: {e}")
+        return []
 
 
 def get_verse_window(
@@ -90,10 +164,15 @@ def get_verse_window(
     translation_code: str,
     before: int = 2,
     after: int = 2,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> List[VerseRow]:
     """
     Fetch a window of verses around a reference.
 
+    Thin canonicalizing wrapper over _get_verse_window_fast: parses the
+    reference, resolves the book via canon.json, and normalizes the
+    translation code.
+
     Example:
         get_verse_window("John 3:16", "KJV", before=2, after=2)
 
@@ -102,10 +181,10 @@ def get_verse_window(
     List[VerseRow]:
         (translation_code, book_num, book_code, chapter, verse, text)
     """
-    translation_code = translation_code.upper()
+    translation_code = sys.intern(translation_code.upper())
     info(
-        f"=== CONTEXT WINDOW === ref={ref!r}, translation={translation_code!r}, "
-        f"before={before}, after={after}"
+        "=== CONTEXT WINDOW === ref=%r, translation=%r, before=%d, after=%d",
+        ref, translation_code, before, after,
     )
 
     parsed = _parse_reference(ref)
@@ -121,26 +200,85 @@ def get_verse_window(
 
     book_lookup = _build_book_lookup(canon)
 
-    num = None
-    for key in (book_str, book_str.lower()):
-        if key in book_lookup:
-            num = book_lookup[key]
-            break
-
+    num = book_lookup.get(book_str.casefold())
     if num is None:
         warn(f"Could not resolve book name {book_str!r} using canon.json.")
         return []
 
-    book_meta = canon[num]
-    book_code = book_meta["code"]
+    rows = _get_verse_window_fast(
+        translation_code, num, chapter, center_verse, before, after, conn=conn
+    )
+    info("Context query returned %d row(s).", len(rows))
+    return rows
 
-    v_start = max(1, center_verse - before)
-    v_end = center_verse + after
+
+def get_verse_windows(
+    refs: List[str],
+    translation_code: str,
+    before: int = 2,
+    after: int = 2,
+    conn: Optional[sqlite3.Connection] = None,
+) -> Dict[str, List[VerseRow]]:
+    """
+    Batched variant of get_verse_window for many references.
+
+    Groups the references by (book_num, chapter), fetches each needed
+    chapter once, and slices the per-ref windows in Python — so a batch
+    of N refs costs one query per distinct chapter instead of one query
+    per ref.
+
+    Returns
+    -------
+    Dict mapping each input ref string to its window rows (empty list
+    when the ref cannot be parsed/resolved or matches no verses).
+    """
+    translation_code = sys.intern(translation_code.upper())
+    info(
+        "=== CONTEXT WINDOWS (batch) === refs=%d, translation=%r, before=%d, after=%d",
+        len(refs), translation_code, before, after,
+    )
+
+    results: Dict[str, List[VerseRow]] = {ref: [] for ref in refs}
+
+    canon = load_canon()
+    if not canon:
+        warn("Canon mapping is empty; cannot resolve books in references.")
+        return results
+
+    book_lookup = _build_book_lookup(canon)
+
+    # (book_num, chapter) -> [(ref, center_verse), ...]
+    centers: Dict[Tuple[int, int], List[Tuple[str, int]]] = {}
+    for ref in refs:
+        parsed = _parse_reference(ref)
+        if parsed is None:
+            continue
+        book_str, chapter, verse = parsed
+        num = book_lookup.get(book_str.casefold())
+        if num is None:
+            warn(f"Could not resolve book name {book_str!r} using canon.json.")
+            continue
+        centers.setdefault((num, chapter), []).append((ref, verse))
+
+    if not centers:
+        return results
+
+    chapter_rows: Dict[Tuple[int, int], List[VerseRow]] = {key: [] for key in centers}
+    keys = list(centers)
 
     try:
-        with get_conn(readonly=True) as conn:
-            cur = conn.execute(
-                """
+        active = conn if conn is not None else _cached_readonly_conn()
+        # Two binds per chapter; chunk to stay well under the host
+        # parameter limit for very large batches.
+        for i in range(0, len(keys), 400):
+            chunk = keys[i : i + 400]
+            cond = " OR ".join("(book_num = ? AND chapter = ?)" for _ in chunk)
+            params: List[Any] = [translation_code]
+            for book_num, chapter in chunk:
+                params.append(book_num)
+                params.append(chapter)
+            cur = active.execute(
+                f"""
                 SELECT translation_code,
                        book_num,
                        book_code,
@@ -149,17 +287,23 @@ def get_verse_window(
                        text
                 FROM verses_normalized
                 WHERE translation_code = ?
-                  AND book_num = ?
-                  AND chapter = ?
-                  AND verse BETWEEN ? AND ?
-                ORDER BY verse;
+                  AND ({cond})
+                ORDER BY book_num, chapter, verse;
                 """,
-                (translation_code, num, chapter, v_start, v_end),
+                params,
             )
-            rows = cur.fetchall()
+            cur.row_factory = None
+            for r in cur:
+                chapter_rows[(r[1], r[3])].append(r)
     except sqlite3.Error as e:
-        warn(f"Database error during context retrieval: {e}")
-        return []
+        warn(f"Database error during batched context retrieval: {e}")
+        return results
+
+    for key, ref_centers in centers.items():
+        rows = chapter_rows[key]
+        for ref, center in ref_centers:
+            v_start = max(1, center - before)
+            v_end = center + after
+            results[ref] = [row for row in rows if v_start <= row[4] <= v_end]
 
-    info(f"Context query returned {len(rows)} row(s).")
-    return [(r[0], r[1], r[2], r[3], r[4], r[5]) for r in rows]
+    return results
@@ -22,12 +22,20 @@ Usage:
 import argparse
 import json
 import os
+import pickle
 import sqlite3
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
+try:
+    # Optional fast path for multi-MB STUDIES/ margin files; orjson
+    # parses several times faster than stdlib json.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
 
 # ========== Data Models ==========
 
@@ -69,6 +77,20 @@ class CorePassageUnit:
     greek_margins: List[GreekMarginRow]
 
 
+# Module-level installer SQL: one string object per statement for the
+# life of the process, so every install_unit call hits the connection's
+# prepared-statement cache instead of re-compiling the SQL text.
+_INS_NOTE_SQL = """
+    INSERT OR IGNORE INTO verse_notes (verse_id, note_kind, unit_id, title, note_md, tags, sort_order)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INS_MARGIN_SQL = """
+    INSERT OR IGNORE INTO greek_margins (verse_id, unit_id, lemma_greek, translit, morph, gloss, note_md, sort_order)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 # ========== Database Utilities ==========
 
 def resolve_db_path(db_arg: Optional[str]) -> Path:
@@ -82,9 +104,21 @@ def resolve_db_path(db_arg: Optional[str]) -> Path:
 
 
 def connect(db_path: Path) -> sqlite3.Connection:
-    """Open database connection with Row factory."""
-    conn = sqlite3.connect(str(db_path))
+    """Open database connection with Row factory and bulk-insert tuning."""
+    conn = sqlite3.connect(str(db_path), cached_statements=512)
     conn.row_factory = sqlite3.Row
+    # Installer connections write in bulk (install_unit); WAL + NORMAL
+    # amortize journal fsyncs across the batch, and the larger cache /
+    # mmap keep the verse-ref join's probe pages in memory.
+    conn.executescript(
+        """
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-65536;
+        PRAGMA mmap_size=268435456;
+        """
+    )
     return conn
 
 
@@ -94,43 +128,81 @@ def table_has_column(conn: sqlite3.Connection, table: str, col: str) -> bool:
     return any(r["name"] == col for r in pragma)
 
 
+# Verse table layout is stable per database file within a process; cache
+# the detection result keyed by DB path to skip repeated sqlite_master
+# probes (one per install_unit call otherwise).
+_verse_table_cache: Dict[str, str] = {}
+
+
 def get_verse_table_name(conn: sqlite3.Connection) -> str:
     """
     Auto-detect which verse table to use.
     Priority: berean_verses > verses_normalized > verses
+
+    Detection is memoized per database file for the life of the process.
     """
+    db_file = conn.execute("PRAGMA database_list").fetchone()[2]
+    if db_file and db_file in _verse_table_cache:
+        return _verse_table_cache[db_file]
+
+    # One sqlite_master probe for all three candidates; priority order
+    # is applied Python-side.
+    present = {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' "
+            "AND name IN ('berean_verses', 'verses_normalized', 'verses');"
+        )
+    }
     for table in ["berean_verses", "verses_normalized", "verses"]:
-        if conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?;",
-            (table,)
-        ).fetchone():
+        if table in present:
+            if db_file:  # in-memory DBs have no stable path to key on
+                _verse_table_cache[db_file] = table
             return table
     raise RuntimeError("No verse table found (expected: berean_verses, verses_normalized, or verses)")
 
 
 def require_verse_table_with_ref(conn: sqlite3.Connection, table_name: str) -> None:
     """Validate verse table has required columns."""
-    if not conn.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name=?;",
-        (table_name,)
-    ).fetchone():
+    # A single table_info PRAGMA covers both the existence check (no
+    # rows for a missing table) and both column checks.
+    cols = {r[1] for r in conn.execute(f"PRAGMA table_info({table_name})")}
+    if not cols:
         raise RuntimeError(f"Missing required table: {table_name}")
-    
+
     # For berean_verses, check 'verse_ref' column
     # For verses/verses_normalized, check 'ref' column
     ref_col = "verse_ref" if table_name == "berean_verses" else "ref"
-    
-    if not table_has_column(conn, table_name, ref_col):
+
+    if ref_col not in cols:
         raise RuntimeError(f"{table_name} table must contain a '{ref_col}' column.")
-    
-    if not table_has_column(conn, table_name, "id"):
+
+    if "id" not in cols:
         raise RuntimeError(f"{table_name} table must contain an 'id' primary key column.")
 
 
+# Database files whose verse table has already been validated, keyed
+# like _verse_table_cache. Keying on the file rather than id(conn)
+# avoids the id-reuse hazard where a fresh connection aliases a
+# garbage-collected one and skips validation.
+_verified_dbs: set = set()
+
+
 def require_verses_ref(conn: sqlite3.Connection) -> None:
-    """Legacy function - now auto-detects table."""
+    """Legacy function - now auto-detects table.
+
+    Validation is memoized per database file: the verse schema is
+    stable for the life of a process here, so repeated install_unit
+    calls skip the sqlite_master/table_info probes. In-memory
+    databases (no stable path) are validated every time.
+    """
+    db_file = conn.execute("PRAGMA database_list").fetchone()[2]
+    if db_file and db_file in _verified_dbs:
+        return
     table_name = get_verse_table_name(conn)
     require_verse_table_with_ref(conn, table_name)
+    if db_file:
+        _verified_dbs.add(db_file)
 
 
 def get_verse_ids_by_ref(conn: sqlite3.Connection, refs: Iterable[str]) -> Dict[str, int]:
@@ -138,40 +210,60 @@ def get_verse_ids_by_ref(conn: sqlite3.Connection, refs: Iterable[str]) -> Dict[
     refs = list(refs)
     if not refs:
         return {}
-    
+
     table_name = get_verse_table_name(conn)
     ref_col = "verse_ref" if table_name == "berean_verses" else "ref"
-    
-    # For berean_verses, try both "Romans 8:26" and "Romans|8:26" formats
+
+    # Join against a VALUES CTE instead of a flat IN (...) list. Selecting
+    # w.ref back out gives us the original query ref for each match, so no
+    # Python-side expanded_refs/ref_map bookkeeping is needed. For
+    # berean_verses the join also tries the "Romans|8:26" <-> "Romans 8:26"
+    # alternate separators in SQL via replace().
     if table_name == "berean_verses":
-        expanded_refs = []
-        ref_map = {}  # maps expanded ref -> original ref
-        for r in refs:
-            expanded_refs.append(r)
-            ref_map[r] = r
-            # Add alternate format
-            alt = r.replace(" ", "|") if " " in r else r.replace("|", " ")
-            expanded_refs.append(alt)
-            ref_map[alt] = r
-        
-        placeholders = ",".join("?" for _ in expanded_refs)
-        rows = conn.execute(
-            f"SELECT id, {ref_col} FROM {table_name} WHERE {ref_col} IN ({placeholders})",
-            expanded_refs,
-        ).fetchall()
-        
-        found = {}
-        for row in rows:
-            original_ref = ref_map[row[ref_col]]
-            found[original_ref] = int(row["id"])
+        join_cond = (
+            f"v.{ref_col} = w.ref"
+            f" OR v.{ref_col} = replace(w.ref, ' ', '|')"
+            f" OR v.{ref_col} = replace(w.ref, '|', ' ')"
+        )
     else:
-        placeholders = ",".join("?" for _ in refs)
-        rows = conn.execute(
-            f"SELECT id, {ref_col} FROM {table_name} WHERE {ref_col} IN ({placeholders})",
-            refs,
-        ).fetchall()
-        found = {r[ref_col]: int(r["id"]) for r in rows}
-    
+        join_cond = f"v.{ref_col} = w.ref"
+
+    if len(refs) > 500:
+        # Large installs: a temp table keeps us clear of the host
+        # parameter limit and gives the join an indexed probe side.
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS tmp_wanted_refs (ref TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM tmp_wanted_refs")
+        conn.executemany(
+            "INSERT OR IGNORE INTO tmp_wanted_refs (ref) VALUES (?)",
+            ((r,) for r in refs),
+        )
+        cur = conn.execute(
+            f"SELECT v.id, w.ref "
+            f"FROM tmp_wanted_refs w JOIN {table_name} v ON {join_cond}"
+        )
+    else:
+        # Pad to the next power of two with an impossible ref so the SQL
+        # text — and therefore its cached prepared statement — is shared
+        # across calls with different ref counts.
+        width = 1
+        while width < len(refs):
+            width <<= 1
+        padded = refs + ["\x00"] * (width - len(refs))
+        values = ",".join("(?)" for _ in padded)
+        cur = conn.execute(
+            f"WITH wanted(ref) AS (VALUES {values}) "
+            f"SELECT v.id, w.ref "
+            f"FROM wanted w JOIN {table_name} v ON {join_cond}",
+            padded,
+        )
+
+    # Plain tuples + integer indexing in the hot loop: skips the
+    # sqlite3.Row name-lookup per field on large ref batches.
+    cur.row_factory = None
+    found = {ref: verse_id for verse_id, ref in cur}
+    if len(refs) > 500:
+        conn.execute("DELETE FROM tmp_wanted_refs")
+
     missing = [r for r in refs if r not in found]
     if missing:
         raise RuntimeError(
@@ -184,87 +276,137 @@ def get_verse_ids_by_ref(conn: sqlite3.Connection, refs: Iterable[str]) -> Dict[
 
 # ========== Schema Management ==========
 
+# Table DDL for cmd_init_schema, run as one executescript batch: the
+# driver parses the whole block in a single pass instead of one
+# prepare/execute crossing per statement.
+_SCHEMA_DDL = """
+    CREATE TABLE IF NOT EXISTS core_passages (
+        unit_id TEXT PRIMARY KEY,
+        category TEXT NOT NULL,
+        title TEXT NOT NULL,
+        range_ref TEXT NOT NULL,
+        summary_md TEXT NOT NULL,
+        tags TEXT NOT NULL DEFAULT ''
+    );
+
+    CREATE TABLE IF NOT EXISTS verse_notes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        verse_id INTEGER NOT NULL,
+        note_kind TEXT NOT NULL DEFAULT 'midrash',
+        unit_id TEXT,
+        title TEXT,
+        note_md TEXT NOT NULL,
+        tags TEXT NOT NULL DEFAULT '',
+        sort_order INTEGER NOT NULL DEFAULT 0,
+        FOREIGN KEY (unit_id) REFERENCES core_passages(unit_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS greek_margins (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        verse_id INTEGER NOT NULL,
+        unit_id TEXT,
+        lemma_greek TEXT NOT NULL,
+        translit TEXT NOT NULL,
+        morph TEXT NOT NULL,
+        gloss TEXT NOT NULL,
+        note_md TEXT NOT NULL DEFAULT '',
+        sort_order INTEGER NOT NULL DEFAULT 0,
+        FOREIGN KEY (unit_id) REFERENCES core_passages(unit_id)
+    );
+"""
+
+_INDEX_DDL = """
+    CREATE INDEX IF NOT EXISTS idx_verse_notes_verse_id ON verse_notes(verse_id);
+    CREATE INDEX IF NOT EXISTS idx_verse_notes_unit_id ON verse_notes(unit_id);
+    CREATE INDEX IF NOT EXISTS idx_greek_margins_verse_id ON greek_margins(verse_id);
+    CREATE INDEX IF NOT EXISTS idx_greek_margins_unit_id ON greek_margins(unit_id);
+"""
+
+
 def cmd_init_schema(args: argparse.Namespace) -> int:
     """Create or verify schema for core passages system."""
     db_path = resolve_db_path(args.db)
-    
+
     with connect(db_path) as conn:
-        # Create core_passages table
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS core_passages (
-                unit_id TEXT PRIMARY KEY,
-                category TEXT NOT NULL,
-                title TEXT NOT NULL,
-                range_ref TEXT NOT NULL,
-                summary_md TEXT NOT NULL,
-                tags TEXT NOT NULL DEFAULT ''
-            );
-        """)
-        
-        # Create verse_notes table
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS verse_notes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                verse_id INTEGER NOT NULL,
-                note_kind TEXT NOT NULL DEFAULT 'midrash',
-                unit_id TEXT,
-                title TEXT,
-                note_md TEXT NOT NULL,
-                tags TEXT NOT NULL DEFAULT '',
-                sort_order INTEGER NOT NULL DEFAULT 0,
-                FOREIGN KEY (unit_id) REFERENCES core_passages(unit_id)
-            );
-        """)
-        
-        # Create greek_margins table
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS greek_margins (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                verse_id INTEGER NOT NULL,
-                unit_id TEXT,
-                lemma_greek TEXT NOT NULL,
-                translit TEXT NOT NULL,
-                morph TEXT NOT NULL,
-                gloss TEXT NOT NULL,
-                note_md TEXT NOT NULL DEFAULT '',
-                sort_order INTEGER NOT NULL DEFAULT 0,
-                FOREIGN KEY (unit_id) REFERENCES core_passages(unit_id)
-            );
-        """)
-        
-        # Create indexes
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_verse_notes_verse_id ON verse_notes(verse_id);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_verse_notes_unit_id ON verse_notes(unit_id);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_greek_margins_verse_id ON greek_margins(verse_id);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_greek_margins_unit_id ON greek_margins(unit_id);")
-        
+        conn.executescript(_SCHEMA_DDL)
+
+        # Create indexes (optionally deferred until after a bulk load,
+        # so inserts don't pay per-row index maintenance)
+        if getattr(args, "defer_indexes", False):
+            print("[info] Index creation deferred; run 'finalize-indexes' after bulk loading.")
+        else:
+            _create_indexes(conn)
+
         conn.commit()
-    
+
     print("[ok] Schema initialized: core_passages, verse_notes, greek_margins")
     return 0
 
 
+def _create_indexes(conn: sqlite3.Connection) -> None:
+    """Create the note/margin lookup indexes (idempotent)."""
+    conn.executescript(_INDEX_DDL)
+
+
+def cmd_finalize_indexes(args: argparse.Namespace) -> int:
+    """Create deferred indexes after a bulk load (see init-schema --defer-indexes)."""
+    db_path = resolve_db_path(args.db)
+
+    with connect(db_path) as conn:
+        _create_indexes(conn)
+        conn.commit()
+
+    print("[ok] Indexes created: verse_notes, greek_margins")
+    return 0
+
+
 # ========== Data Installation ==========
 
 def install_unit(conn: sqlite3.Connection, unit: CorePassageUnit) -> tuple[int, int]:
     """
     Install a complete core passage unit.
     
+    The whole unit is written inside one explicit BEGIN IMMEDIATE
+    transaction: the write lock is taken once up front instead of being
+    acquired/released around each statement, and a failure rolls the
+    unit back as a whole.
+
     Returns:
         (notes_added, margins_added)
     """
     require_verses_ref(conn)
-    
+
     # Collect all verse refs
     all_refs = set()
     for note in unit.verse_notes:
         all_refs.add(note.ref)
     for margin in unit.greek_margins:
         all_refs.add(margin.ref)
-    
+
     # Get verse IDs
     verse_id_map = get_verse_ids_by_ref(conn, all_refs)
-    
+
+    # The ref lookup above may have opened an implicit transaction (its
+    # temp-table path issues DML); flush it so BEGIN doesn't nest.
+    if conn.in_transaction:
+        conn.commit()
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        notes_added, margins_added = _install_unit_rows(conn, unit, verse_id_map)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return notes_added, margins_added
+
+
+def _install_unit_rows(
+    conn: sqlite3.Connection,
+    unit: CorePassageUnit,
+    verse_id_map: Dict[str, int],
+) -> tuple[int, int]:
+    """Write one unit's rows; runs inside install_unit's transaction."""
     # Insert core passage metadata (upsert)
     conn.execute("""
         INSERT INTO core_passages (unit_id, category, title, range_ref, summary_md, tags)
@@ -277,31 +419,61 @@ def install_unit(conn: sqlite3.Connection, unit: CorePassageUnit) -> tuple[int,
             tags = excluded.tags
     """, (unit.unit_id, unit.category, unit.title, unit.range_ref, unit.summary_md, unit.tags))
     
-    # Insert verse notes
-    notes_added = 0
-    for note in unit.verse_notes:
-        verse_id = verse_id_map[note.ref]
-        conn.execute("""
-            INSERT OR IGNORE INTO verse_notes (verse_id, note_kind, unit_id, title, note_md, tags, sort_order)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (verse_id, note.note_kind, note.unit_id, note.title, note.note_md, note.tags, note.sort_order))
-        notes_added += conn.execute("SELECT changes()").fetchone()[0]
-    
-    # Insert greek margins
-    margins_added = 0
-    for margin in unit.greek_margins:
-        verse_id = verse_id_map[margin.ref]
-        conn.execute("""
-            INSERT OR IGNORE INTO greek_margins (verse_id, unit_id, lemma_greek, translit, morph, gloss, note_md, sort_order)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (verse_id, margin.unit_id, margin.lemma_greek, margin.translit, margin.morph, margin.gloss, margin.note_md, margin.sort_order))
-        margins_added += conn.execute("SELECT changes()").fetchone()[0]
-    
+    # Insert verse notes and greek margins in bulk. executemany keeps
+    # the whole batch inside one engine call per table, and the
+    # total_changes delta replaces the per-row SELECT changes()
+    # round-trip (INSERT OR IGNORE rows that hit a conflict don't count).
+    note_rows = [
+        (verse_id_map[n.ref], n.note_kind, n.unit_id, n.title, n.note_md, n.tags, n.sort_order)
+        for n in unit.verse_notes
+    ]
+    before = conn.total_changes
+    conn.executemany(_INS_NOTE_SQL, note_rows)
+    notes_added = conn.total_changes - before
+
+    margin_rows = [
+        (verse_id_map[m.ref], m.unit_id, m.lemma_greek, m.translit, m.morph, m.gloss, m.note_md, m.sort_order)
+        for m in unit.greek_margins
+    ]
+    before = conn.total_changes
+    conn.executemany(_INS_MARGIN_SQL, margin_rows)
+    margins_added = conn.total_changes - before
+
     return notes_added, margins_added
 
 
 # ========== JSON Loader ==========
 
+def _load_cached_json(path: Path):
+    """
+    Parse a STUDIES/ JSON file with a pickle sidecar cache.
+
+    A sibling <name>.json.pkl is consulted first; it is used only when
+    its mtime is at least the JSON's, so editing the JSON invalidates
+    the cache. unpickling is an order of magnitude faster than JSON
+    parsing, which makes repeat CLI installs of the same unit
+    near-instant. Cache write failures (read-only checkout) are ignored.
+    """
+    cache_path = path.with_suffix(path.suffix + ".pkl")
+    try:
+        if cache_path.stat().st_mtime >= path.stat().st_mtime:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    with open(path, "rb") as f:
+        data = _json_loads(f.read())
+
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return data
+
+
+
 def load_unit_from_json_files(
     greek_margins_json: Path,
     verse_notes_json: Path,
@@ -319,8 +491,7 @@ def load_unit_from_json_files(
         CorePassageUnit with data from JSON files
     """
     # Load greek margins
-    with open(greek_margins_json, "r", encoding="utf-8") as f:
-        gm_data = json.load(f)
+    gm_data = _load_cached_json(greek_margins_json)
     
     greek_margins = [
         GreekMarginRow(
@@ -337,8 +508,7 @@ def load_unit_from_json_files(
     ]
     
     # Load verse notes
-    with open(verse_notes_json, "r", encoding="utf-8") as f:
-        vn_data = json.load(f)
+    vn_data = _load_cached_json(verse_notes_json)
     
     verse_notes = [
         VerseNoteRow(
@@ -354,16 +524,13 @@ def load_unit_from_json_files(
     ]
     
     # Load core passage metadata
-    with open(core_passage_json, "r", encoding="utf-8") as f:
-        cp_data = json.load(f)
-    
-    # Find matching passage by unit_id
-    passage = None
-    for p in cp_data["passages"]:
-        if p["unit_id"] == gm_data["unit_id"]:
-            passage = p
-            break
+    cp_data = _load_cached_json(core_passage_json)
     
+    # Find matching passage by unit_id (dict build + O(1) probe instead
+    # of a linear scan per load)
+    passages_by_id = {p["unit_id"]: p for p in cp_data["passages"]}
+    passage = passages_by_id.get(gm_data["unit_id"])
+
     if not passage:
         raise ValueError(
             f"No passage with unit_id={gm_data['unit_id']} found in {core_passage_json}"
@@ -424,15 +591,11 @@ def cmd_add_romans8(args: argparse.Namespace) -> int:
     
     db_path = resolve_db_path(args.db)
     unit = romans8_sanctification_core_unit()
-    
+
     with connect(db_path) as conn:
-        try:
-            notes_added, margins_added = install_unit(conn, unit)
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-    
+        # install_unit manages its own BEGIN IMMEDIATE/COMMIT.
+        notes_added, margins_added = install_unit(conn, unit)
+
     print(f"[ok] Installed core passage unit {unit.unit_id}")
     print(f"  - verse_notes added:   {notes_added}")
     print(f"  - greek_margins added: {margins_added}")
@@ -451,13 +614,9 @@ def cmd_add_from_json(args: argparse.Namespace) -> int:
     )
     
     with connect(db_path) as conn:
-        try:
-            notes_added, margins_added = install_unit(conn, unit)
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-    
+        # install_unit manages its own BEGIN IMMEDIATE/COMMIT.
+        notes_added, margins_added = install_unit(conn, unit)
+
     print(f"[ok] Installed core passage unit {unit.unit_id}")
     print(f"  - verse_notes added:   {notes_added}")
     print(f"  - greek_margins added: {margins_added}")
@@ -478,8 +637,13 @@ def build_parser() -> argparse.ArgumentParser:
     sub = p.add_subparsers(dest="cmd", required=True)
 
     s1 = sub.add_parser("init-schema", help="Create/ensure core_passages, verse_notes, greek_margins tables + indexes.")
+    s1.add_argument("--defer-indexes", action="store_true",
+                    help="Skip index creation for faster bulk loading; run finalize-indexes afterwards.")
     s1.set_defaults(func=cmd_init_schema)
 
+    s1b = sub.add_parser("finalize-indexes", help="Create the note/margin indexes deferred by init-schema --defer-indexes.")
+    s1b.set_defaults(func=cmd_finalize_indexes)
+
     s2 = sub.add_parser("add-romans8-sanctification-core", help="Install Romans 8:18–30 as sanctification core passage (hardcoded - DEPRECATED).")
     s2.set_defaults(func=cmd_add_romans8)
     
@@ -3,12 +3,42 @@ Database connection management for the Study Bible Compendium.
 """
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from typing import Generator
 
 from .paths import DB_PATH
 
 
+_ro_local = threading.local()
+
+
+def get_shared_ro_conn() -> sqlite3.Connection:
+    """
+    Per-thread cached read-only connection.
+
+    Health-check style callers (ping) and repeated small reads would
+    otherwise pay the full VFS open + PRAGMA setup on every call; this
+    opens once per thread and reuses the connection for the life of the
+    process. query_only hard-enforces read-only use.
+    """
+    conn = getattr(_ro_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True, cached_statements=512)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(
+            """
+            PRAGMA query_only=1;
+            PRAGMA busy_timeout=5000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            """
+        )
+        _ro_local.conn = conn
+    return conn
+
+
 @contextmanager
 def get_conn(readonly: bool = False) -> Generator[sqlite3.Connection, None, None]:
     """
@@ -20,9 +50,30 @@ def get_conn(readonly: bool = False) -> Generator[sqlite3.Connection, None, None
     Yields:
         sqlite3.Connection with row_factory set to Row
     """
-    uri = f"file:{DB_PATH}?mode=ro" if readonly else str(DB_PATH)
-    conn = sqlite3.connect(uri, uri=readonly)
+    if readonly:
+        # Read paths are backed by the per-thread cached connection: the
+        # `with get_conn(readonly=True)` call sites stay unchanged, but
+        # the connection survives the block instead of being closed, so
+        # repeated reads skip the open/PRAGMA cost and (with WAL on the
+        # writer side) run concurrently with imports. One connection per
+        # thread is this repo's pool.
+        yield get_shared_ro_conn()
+        return
+
+    # Larger statement cache so hot queries keep their prepared plans
+    # instead of re-compiling SQL text (default cache is 128 entries).
+    conn = sqlite3.connect(str(DB_PATH), cached_statements=512)
     conn.row_factory = sqlite3.Row
+    # Per-connection tuning, set once at open. mmap lets the kernel
+    # serve hot verse pages without a pager copy; temp_store keeps sort
+    # spills in RAM. Writers additionally get WAL (concurrent readers
+    # during imports) and NORMAL synchronous; busy_timeout retries the
+    # write lock instead of failing fast when a reader holds it.
+    conn.executescript(
+        "PRAGMA temp_store=MEMORY; PRAGMA mmap_size=268435456;"
+        " PRAGMA cache_size=-65536; PRAGMA busy_timeout=5000;"
+        " PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;"
+    )
     try:
         yield conn
     finally:
@@ -38,10 +89,9 @@ def ping() -> bool:
     """
     if not DB_PATH.exists():
         return False
-    
+
     try:
-        with get_conn(readonly=True) as conn:
-            conn.execute("SELECT 1")
+        get_shared_ro_conn().execute("SELECT 1")
         return True
     except Exception:
         return False
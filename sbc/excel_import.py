@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import csv
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Iterator, Optional, Tuple, List
 
@@ -40,10 +41,23 @@ HEADER_CANDIDATES: Dict[str, List[str]] = {
 }
 
 
+# Inverted candidate index: one dict probe per header cell instead of
+# scanning every candidate list per logical column.
+_HEADER_INDEX: Dict[str, str] = {
+    cand: logical
+    for logical, cands in HEADER_CANDIDATES.items()
+    for cand in cands
+}
+
+# Separator strip table for str.translate: one C pass over the header
+# instead of three chained replace() copies.
+_NORM_TBL = str.maketrans("", "", " -_")
+
+
 def _normalize_header(value: object) -> str:
     if value is None:
         return ""
-    return str(value).strip().lower().replace(" ", "").replace("-", "").replace("_", "")
+    return str(value).strip().lower().translate(_NORM_TBL)
 
 
 def _detect_column_mapping(headers: List[object]) -> Optional[Dict[str, int]]:
@@ -52,19 +66,18 @@ def _detect_column_mapping(headers: List[object]) -> Optional[Dict[str, int]]:
     Returns a mapping { 'book': idx, 'chapter': idx, 'verse': idx, 'text': idx }
     or None if detection fails.
     """
-    norm_headers = [_normalize_header(h) for h in headers]
+    # Single pass over the headers; the first matching column wins for
+    # each logical name, as before.
     mapping: Dict[str, int] = {}
+    for i, h in enumerate(headers):
+        logical = _HEADER_INDEX.get(_normalize_header(h))
+        if logical is not None and logical not in mapping:
+            mapping[logical] = i
 
-    for logical_name, candidates in HEADER_CANDIDATES.items():
-        idx_found: Optional[int] = None
-        for i, norm in enumerate(norm_headers):
-            if any(norm == cand for cand in candidates):
-                idx_found = i
-                break
-        if idx_found is None:
+    for logical_name in HEADER_CANDIDATES:
+        if logical_name not in mapping:
             warn(f"Could not detect column for '{logical_name}'. Headers were: {headers}")
             return None
-        mapping[logical_name] = idx_found
 
     return mapping
 
@@ -113,7 +126,7 @@ def _iter_verses_from_csv(
     """Handle CSV file import."""
     info(f"Opening CSV file: {csv_path}")
     
-    with open(csv_path, 'r', encoding='utf-8') as f:
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
         reader = csv.reader(f)
         
         try:
@@ -128,29 +141,31 @@ def _iter_verses_from_csv(
             warn("Failed to detect required columns; aborting CSV import.")
             return
         
+        # Pre-bind the column indices once; itemgetter projects all four
+        # fields in a single C call per row, so the loop body is pure
+        # row traversal without per-field subscript bytecode.
+        b_i, c_i, v_i, t_i = (
+            mapping["book"], mapping["chapter"], mapping["verse"], mapping["text"]
+        )
+        max_i = max(b_i, c_i, v_i, t_i)
+        pick = itemgetter(b_i, c_i, v_i, t_i)
+
         count = 0
         for row_idx, row in enumerate(reader, start=2):  # 1-based, +1 for header
             if max_rows is not None and count >= max_rows:
                 info(f"Stopping after max_rows={max_rows} rows.")
                 break
-            
-            if len(row) < max(mapping.values()) + 1:
+
+            if len(row) <= max_i:
                 warn(f"Row {row_idx}: not enough columns; skipping.")
                 continue
-            
-            try:
-                book_raw = row[mapping["book"]]
-                chapter_raw = row[mapping["chapter"]]
-                verse_raw = row[mapping["verse"]]
-                text_raw = row[mapping["text"]]
-            except IndexError:
-                warn(f"Row {row_idx}: column access error; skipping.")
-                continue
-            
-            if not book_raw or not chapter_raw or not verse_raw:
+
+            book_raw, chapter_raw, verse_raw, text_raw = pick(row)
+
+            if not (book_raw and chapter_raw and verse_raw):
                 warn(f"Row {row_idx}: missing book/chapter/verse; skipping.")
                 continue
-            
+
             text_str = text_raw.strip() if text_raw else ""
             if not text_str:
                 warn(f"Row {row_idx}: empty verse text; skipping.")
@@ -208,65 +223,76 @@ def _iter_verses_from_xlsx(
         ws = wb[sheet_name]
         info(f"Using sheet: {ws.title!r}")
 
-    rows = ws.iter_rows(values_only=True)
     try:
-        headers = next(rows)
-    except StopIteration:
-        warn("Excel sheet is empty.")
-        return
+        rows = ws.iter_rows(values_only=True)
+        try:
+            headers = next(rows)
+        except StopIteration:
+            warn("Excel sheet is empty.")
+            return
 
-    headers_list = list(headers)
-    info(f"Detected header row: {headers_list}")
-    mapping = _detect_column_mapping(headers_list)
-    if mapping is None:
-        warn("Failed to detect required columns; aborting Excel import.")
-        return
+        headers_list = list(headers)
+        info(f"Detected header row: {headers_list}")
+        mapping = _detect_column_mapping(headers_list)
+        if mapping is None:
+            warn("Failed to detect required columns; aborting Excel import.")
+            return
 
-    count = 0
-    for row_idx, row in enumerate(rows, start=2):  # 1-based row index; +1 for header
-        if max_rows is not None and count >= max_rows:
-            info(f"Stopping after max_rows={max_rows} rows.")
-            break
+        # Pre-bind the column indices to locals (see the CSV path).
+        b_i, c_i, v_i, t_i = (
+            mapping["book"], mapping["chapter"], mapping["verse"], mapping["text"]
+        )
+        max_i = max(b_i, c_i, v_i, t_i)
 
-        row_list = list(row)
+        count = 0
+        for row_idx, row in enumerate(rows, start=2):  # 1-based row index; +1 for header
+            if max_rows is not None and count >= max_rows:
+                info(f"Stopping after max_rows={max_rows} rows.")
+                break
 
-        try:
-            book_raw = row_list[mapping["book"]]
-            chapter_raw = row_list[mapping["chapter"]]
-            verse_raw = row_list[mapping["verse"]]
-            text_raw = row_list[mapping["text"]]
-        except IndexError:
-            warn(f"Row {row_idx}: not enough columns; skipping.")
-            continue
-
-        if book_raw is None or chapter_raw is None or verse_raw is None:
-            warn(f"Row {row_idx}: missing book/chapter/verse; skipping.")
-            continue
-
-        text_str = "" if text_raw is None else str(text_raw).strip()
-        if not text_str:
-            # Allow empty text? For now, skip.
-            warn(f"Row {row_idx}: empty verse text; skipping.")
-            continue
+            # values_only rows are plain tuples; index them directly
+            # rather than copying each one into a list first.
+            if len(row) <= max_i:
+                warn(f"Row {row_idx}: not enough columns; skipping.")
+                continue
 
-        try:
-            chapter_int = int(chapter_raw)
-            verse_int = int(verse_raw)
-        except (TypeError, ValueError):
-            warn(f"Row {row_idx}: non-integer chapter/verse; skipping. "
-                 f"chapter={chapter_raw!r}, verse={verse_raw!r}")
-            continue
-
-        book_str = str(book_raw).strip()
-        if not book_str:
-            warn(f"Row {row_idx}: empty book value; skipping.")
-            continue
-
-        yield ExcelVerseRow(
-            book=book_str,
-            chapter=chapter_int,
-            verse=verse_int,
-            text=text_str,
-            raw_row_index=row_idx,
-        )
-        count += 1
+            book_raw = row[b_i]
+            chapter_raw = row[c_i]
+            verse_raw = row[v_i]
+            text_raw = row[t_i]
+
+            if book_raw is None or chapter_raw is None or verse_raw is None:
+                warn(f"Row {row_idx}: missing book/chapter/verse; skipping.")
+                continue
+
+            text_str = "" if text_raw is None else str(text_raw).strip()
+            if not text_str:
+                # Allow empty text? For now, skip.
+                warn(f"Row {row_idx}: empty verse text; skipping.")
+                continue
+
+            try:
+                chapter_int = int(chapter_raw)
+                verse_int = int(verse_raw)
+            except (TypeError, ValueError):
+                warn(f"Row {row_idx}: non-integer chapter/verse; skipping. "
+                     f"chapter={chapter_raw!r}, verse={verse_raw!r}")
+                continue
+
+            book_str = str(book_raw).strip()
+            if not book_str:
+                warn(f"Row {row_idx}: empty book value; skipping.")
+                continue
+
+            yield ExcelVerseRow(
+                book=book_str,
+                chapter=chapter_int,
+                verse=verse_int,
+                text=text_str,
+                raw_row_index=row_idx,
+            )
+            count += 1
+    finally:
+        # Read-only workbooks keep the underlying zip handle open until
+        # explicitly closed.
+        wb.close()
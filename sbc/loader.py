@@ -10,68 +10,107 @@ This module now:
 
 from __future__ import annotations
 
+from collections import Counter
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 
 import json
+import queue
+import sqlite3
+import sys
+import threading
 
 from .db import get_conn
 from .util import info, warn
 from .paths import SCHEMA_DIR, DATA_DIR
-from .model import VerseRef
 from .excel_import import iter_verses_from_excel, ExcelVerseRow
 
+try:
+    # Optional fast path mirroring sbc.core_passages: orjson parses
+    # UTF-8 bytes directly, skipping the str decode stdlib json needs.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
 
-def _apply_schema(path: Path) -> None:
+
+def _apply_schema(path: Path, conn: Optional[sqlite3.Connection] = None) -> None:
     if not path.exists():
         warn(f"Schema file not found: {path}")
         return
     sql = path.read_text(encoding="utf-8")
     info(f"Applying schema from: {path}")
+    if conn is not None:
+        conn.executescript(sql)
+        return
     with get_conn() as conn:
+        # Autocommit for the DDL phase: skips the implicit BEGIN/COMMIT
+        # the sqlite3 wrapper would otherwise add around the script.
+        conn.isolation_level = None
         conn.executescript(sql)
-        conn.commit()
 
 
-def ensure_verse_schema() -> None:
+def ensure_verse_schema(conn: Optional[sqlite3.Connection] = None) -> None:
     """
     Apply the verse schema SQL file to the database (idempotent).
+
+    Pass an open connection to reuse it instead of opening a fresh one.
     """
-    _apply_schema(SCHEMA_DIR / "verse_schema.sql")
+    _apply_schema(SCHEMA_DIR / "verse_schema.sql", conn=conn)
 
 
-def ensure_translations_schema() -> None:
+def ensure_translations_schema(conn: Optional[sqlite3.Connection] = None) -> None:
     """
     Apply the translations schema SQL file to the database (idempotent).
+
+    Pass an open connection to reuse it instead of opening a fresh one.
     """
-    _apply_schema(SCHEMA_DIR / "translations.sql")
+    _apply_schema(SCHEMA_DIR / "translations.sql", conn=conn)
+
+
+# canon.json is immutable at runtime; parse it once per process so the
+# hot reference-resolution paths (context windows, passage parsing) pay
+# a dict probe instead of a JSON parse per call.
+_canon_cache: Optional[Dict[int, Dict[str, Any]]] = None
 
 
 def load_canon() -> Dict[int, Dict[str, Any]]:
     """
     Load the 66-book canon definition from data/canon.json.
 
+    The parsed mapping is cached for the life of the process.
+
     Returns
     -------
     dict:
         Map of book_num -> { "code": str, "name": str, "testament": str }
     """
+    global _canon_cache
+    if _canon_cache is not None:
+        return _canon_cache
+
     canon_path = DATA_DIR / "canon.json"
     if not canon_path.exists():
         warn(f"canon.json not found at: {canon_path}")
         return {}
 
-    data = json.loads(canon_path.read_text(encoding="utf-8"))
+    # read_bytes + loads: one UTF-8 decode inside the parser instead of
+    # read_text decoding first and the parser scanning the str again.
+    data = _json_loads(canon_path.read_bytes())
 
     result: Dict[int, Dict[str, Any]] = {}
     for entry in data:
         num = int(entry["book_num"])
+        # Intern codes/names: these few dozen strings are compared and
+        # stored per verse row all over the codebase, and interning makes
+        # equality checks pointer compares and collapses duplicates.
         result[num] = {
-            "code": entry["code"],
-            "name": entry["name"],
-            "testament": entry.get("testament", "unknown"),
+            "code": sys.intern(entry["code"]),
+            "name": sys.intern(entry["name"]),
+            "testament": sys.intern(entry.get("testament", "unknown")),
         }
+
+    _canon_cache = result
     return result
 
 
@@ -117,49 +156,65 @@ def _resolve_book(book_str: str, book_lookup: Dict[str, int]) -> Optional[Tuple[
     return num, None  # book_code will be looked up from canon by num
 
 
+def _upsert_translation(
+    conn: sqlite3.Connection,
+    code: str,
+    name: str,
+    language: str,
+    source_notes: str,
+) -> None:
+    """Run the translations upsert on an open connection (no commit)."""
+    imported_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    conn.execute(
+        """
+        INSERT INTO translations (code, name, language, source_notes, imported_utc)
+        VALUES (:code, :name, :language, :source_notes, :imported_utc)
+        ON CONFLICT(code) DO UPDATE SET
+            name         = excluded.name,
+            language     = excluded.language,
+            source_notes = excluded.source_notes,
+            imported_utc = excluded.imported_utc;
+        """,
+        {
+            "code": code,
+            "name": name,
+            "language": language,
+            "source_notes": source_notes,
+            "imported_utc": imported_utc,
+        },
+    )
+
+
 def register_translation(
     code: str,
     name: Optional[str],
     language: str,
     source_notes: str,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> None:
     """
     Insert or update a translation row in the `translations` table.
 
-    If name is None, we fall back to using the code as the name.
+    If name is None, we fall back to using the code as the name. When a
+    connection is passed, the upsert runs on it without committing (the
+    caller owns the transaction) and the schema is assumed applied.
     """
-    ensure_translations_schema()
-
     code = code.upper()
     if not name:
         name = code
 
-    imported_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
     info(f"Registering translation {code!r} in translations table.")
-    with get_conn() as conn:
-        conn.execute(
-            """
-            INSERT INTO translations (code, name, language, source_notes, imported_utc)
-            VALUES (:code, :name, :language, :source_notes, :imported_utc)
-            ON CONFLICT(code) DO UPDATE SET
-                name         = excluded.name,
-                language     = excluded.language,
-                source_notes = excluded.source_notes,
-                imported_utc = excluded.imported_utc;
-            """,
-            {
-                "code": code,
-                "name": name,
-                "language": language,
-                "source_notes": source_notes,
-                "imported_utc": imported_utc,
-            },
-        )
-        conn.commit()
+    if conn is not None:
+        _upsert_translation(conn, code, name, language, source_notes)
+        return
+
+    ensure_translations_schema()
+    with get_conn() as fresh:
+        _upsert_translation(fresh, code, name, language, source_notes)
+        fresh.commit()
 
 
-def import_bible_from_excel(
+def import_bible(
     excel_path: Path,
     translation_code: str,
     overwrite: bool = False,
@@ -168,12 +223,17 @@ def import_bible_from_excel(
     max_rows: Optional[int] = None,
 ) -> None:
     """
-    Import a single Bible translation from an Excel file into the database.
+    Import a single Bible translation from an Excel or CSV file.
+
+    CSV input (e.g. the output of create_test_sample.py) takes a fast
+    path through csv.reader in sbc.excel_import, skipping the openpyxl
+    ZIP/XML stack entirely; .xlsx goes through the streaming Excel
+    reader.
 
     Parameters
     ----------
     excel_path:
-        Path to the Excel file to import.
+        Path to the Excel or CSV file to import.
     translation_code:
         Short code for the translation (e.g. 'KJV', 'BSB', 'ASV').
     overwrite:
@@ -200,10 +260,6 @@ def import_bible_from_excel(
     info(f"Dry run          : {dry_run}")
     info(f"Max rows         : {max_rows if max_rows is not None else '(no limit)'}")
 
-    # Ensure schemas are in place
-    ensure_verse_schema()
-    ensure_translations_schema()
-
     # Load canon mapping
     canon = load_canon()
     if not canon:
@@ -212,64 +268,151 @@ def import_bible_from_excel(
 
     book_lookup = _build_book_lookup(canon)
 
-    # Gather rows from Excel
-    rows: List[ExcelVerseRow] = list(
-        iter_verses_from_excel(excel_path, sheet_name=sheet_name, max_rows=max_rows)
-    )
-    if not rows:
-        warn("No usable verse rows found in Excel file.")
-        return
+    # Producer/consumer pipeline: a parser thread reads the file (CSV or
+    # openpyxl's ZIP/XML stack) and feeds 1000-row batches through a
+    # bounded queue while this thread normalizes and writes. With WAL on
+    # the writer side, end-to-end time approaches max(parse, write)
+    # instead of their sum.
+    batches: "queue.Queue" = queue.Queue(maxsize=4)
+    producer_error: List[BaseException] = []
+
+    def _produce() -> None:
+        batch: List[ExcelVerseRow] = []
+        try:
+            for r in iter_verses_from_excel(
+                excel_path, sheet_name=sheet_name, max_rows=max_rows
+            ):
+                batch.append(r)
+                if len(batch) >= 1000:
+                    batches.put(batch)
+                    batch = []
+            if batch:
+                batches.put(batch)
+        except BaseException as e:  # re-raised on the consumer side
+            producer_error.append(e)
+        finally:
+            batches.put(None)
+
+    producer = threading.Thread(target=_produce, name="sbc-import-parser", daemon=True)
+    producer.start()
+
+    # Hot-loop specialization: book codes are pre-uppercased into a flat
+    # num->code dict, the book resolution is inlined (one or two dict
+    # probes instead of the _resolve_book call), and the normalized ref
+    # is formatted directly rather than via a throwaway VerseRef.
+    code_by_num = {num: meta["code"].upper() for num, meta in canon.items()}
+
+    # Unresolved book strings are tallied instead of warned per row: a
+    # systematically mislabeled column would otherwise emit one stderr
+    # line per data row, and that I/O can dominate the import.
+    skipped_books: Counter = Counter()
+
+    def _normalize(batch: List[ExcelVerseRow]) -> Tuple[List[Tuple], int]:
+        db_rows: List[Tuple[str, int, str, int, int, str, str, int]] = []
+        append = db_rows.append
+        lookup_get = book_lookup.get
+        skipped = 0
+        for r in batch:
+            book = r.book
+            book_num = lookup_get(book)
+            if book_num is None:
+                book_num = lookup_get(book.lower())
+            if book_num is None:
+                skipped_books[book] += 1
+                skipped += 1
+                continue
+
+            book_code = code_by_num[book_num]
+            chapter = r.chapter
+            verse = r.verse
+
+            text = r.text.strip()
+            word_count = len(text.split()) if text else 0
+
+            append(
+                (
+                    translation_code,
+                    book_num,
+                    book_code,
+                    chapter,
+                    verse,
+                    f"{book_code}.{chapter}.{verse}",
+                    text,
+                    word_count,
+                )
+            )
+        return db_rows, skipped
+
+    def _warn_skipped_books() -> None:
+        if skipped_books:
+            total = sum(skipped_books.values())
+            warn(
+                f"Skipped {total} rows across {len(skipped_books)} unresolved "
+                f"book strings: {dict(skipped_books.most_common(10))}"
+            )
 
-    info(f"Parsed {len(rows)} verse rows from Excel.")
+    insert_sql = """
+        INSERT INTO verses_normalized (
+            translation_code,
+            book_num,
+            book_code,
+            chapter,
+            verse,
+            normalized_ref,
+            text,
+            word_count
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+    """
 
-    # Normalize rows into DB-ready tuples
-    db_rows: List[Tuple[str, int, str, int, int, str, str, int]] = []
+    parsed = 0
+    inserted = 0
     skipped = 0
 
-    for r in rows:
-        resolved = _resolve_book(r.book, book_lookup)
-        if resolved is None:
-            warn(f"Row {r.raw_row_index}: could not resolve book {r.book!r}; skipping.")
-            skipped += 1
-            continue
-
-        book_num, _ = resolved
-        book_meta = canon[book_num]
-        book_code = book_meta["code"]
-
-        vref = VerseRef(book_num=book_num, chapter=r.chapter, verse=r.verse)
-        norm_ref = vref.to_normalized(book_code)
-
-        text = r.text.strip()
-        word_count = len(text.split()) if text else 0
-
-        db_rows.append(
-            (
-                translation_code,
-                book_num,
-                book_code,
-                r.chapter,
-                r.verse,
-                norm_ref,
-                text,
-                word_count,
-            )
-        )
-
-    info(f"Prepared {len(db_rows)} rows for insertion; skipped {skipped} rows.")
+    # Peek the first batch before touching the database so an empty or
+    # unparseable file doesn't delete existing rows under --overwrite.
+    first = batches.get()
+    producer_failed = False
+    if first is None:
+        producer.join()
+        if producer_error:
+            raise producer_error[0]
+        warn("No usable verse rows found in Excel file.")
+        return
 
     if dry_run:
         info("Dry run enabled – no rows will be written to the database.")
+        batch = first
+        while batch is not None:
+            parsed += len(batch)
+            db_rows, batch_skipped = _normalize(batch)
+            skipped += batch_skipped
+            inserted += len(db_rows)
+            batch = batches.get()
+        producer.join()
+        if producer_error:
+            raise producer_error[0]
+        _warn_skipped_books()
+        info(f"Parsed {parsed} verse rows from Excel.")
+        info(f"Prepared {inserted} rows for insertion; skipped {skipped} rows.")
         return
 
-    if not db_rows:
-        warn("No rows to insert after normalization. Nothing written.")
-        return
-
-    # Insert into DB
     with get_conn() as conn:
         cur = conn.cursor()
 
+        # One connection for the whole import: schema DDL, the verse
+        # inserts, and the translations upsert all run here, so the
+        # import pays a single open and a single commit fsync instead
+        # of three connection cycles. executescript commits as it goes,
+        # so the schemas land before the explicit transaction below.
+        ensure_verse_schema(conn)
+        ensure_translations_schema(conn)
+
+        # Bulk-load PRAGMAs (WAL, NORMAL synchronous, temp_store=MEMORY)
+        # are applied by get_conn at open time. Take the write lock once
+        # up front: the whole import (delete + all batches) runs in one
+        # explicit transaction with a single commit fsync at the end.
+        cur.execute("BEGIN IMMEDIATE")
+
         if overwrite:
             info(f"Deleting existing verses for translation {translation_code!r}...")
             cur.execute(
@@ -278,36 +421,51 @@ def import_bible_from_excel(
             )
 
         info("Inserting verse rows into `verses_normalized` table...")
-        cur.executemany(
-            """
-            INSERT INTO verses_normalized (
-                translation_code,
-                book_num,
-                book_code,
-                chapter,
-                verse,
-                normalized_ref,
-                text,
-                word_count
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
-            """,
-            db_rows,
+        batch = first
+        while batch is not None:
+            parsed += len(batch)
+            db_rows, batch_skipped = _normalize(batch)
+            skipped += batch_skipped
+            if db_rows:
+                cur.executemany(insert_sql, db_rows)
+                inserted += len(db_rows)
+            batch = batches.get()
+
+        producer.join()
+        if producer_error:
+            conn.rollback()
+            raise producer_error[0]
+
+        if not inserted:
+            conn.rollback()
+            warn("No rows to insert after normalization. Nothing written.")
+            return
+
+        # Register translation in the same transaction (basic guess for
+        # name/language/source; refine later via config or CLI flags).
+        register_translation(
+            code=translation_code,
+            name=None,          # fallback to code
+            language="en",      # default assumption
+            source_notes=f"Imported from Excel file {excel_path.name}",
+            conn=conn,
         )
+
         conn.commit()
 
-    info(f"Import complete. Inserted {len(db_rows)} verses for {translation_code!r}.")
+        # Refresh planner statistics so the covering index is preferred
+        # for passage/context lookups on the newly loaded data.
+        conn.execute("ANALYZE verses_normalized;")
+
+    _warn_skipped_books()
+    info(f"Parsed {parsed} verse rows from Excel.")
+    info(f"Import complete. Inserted {inserted} verses for {translation_code!r}.")
     if skipped:
         info(f"Skipped {skipped} rows due to book/structure issues.")
 
-    # Register translation (basic guess for name/language/source)
-    # You can refine these later (e.g., config or CLI flags)
-    source_notes = f"Imported from Excel file {excel_path.name}"
-    register_translation(
-        code=translation_code,
-        name=None,          # fallback to code
-        language="en",      # default assumption
-        source_notes=source_notes,
-    )
+
+# Backwards-compatible alias from before CSV input was supported.
+import_bible_from_excel = import_bible
 
 
 def list_loaded_translations() -> None:
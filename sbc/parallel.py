@@ -6,6 +6,7 @@ return the same verse(s) across multiple translations in one structure.
 
 Public API:
 
+- iter_parallel_verses(ref, translation_codes) -> Iterator[ParallelRow]
 - get_parallel_verses(ref, translation_codes) -> List[ParallelRow]
 - print_parallel(ref, translation_codes, rows)
 
@@ -15,10 +16,14 @@ ParallelRow shape:
 
 from __future__ import annotations
 
-from typing import List, Dict, Tuple, Optional, Any
+from functools import lru_cache
+from itertools import chain, groupby
+from operator import itemgetter
+from typing import Iterator, List, Dict, Tuple, Optional, Any
+import re
 import sqlite3
 
-from .db import get_conn
+from .db import get_shared_ro_conn
 from .util import info, warn
 from .loader import load_canon
 
@@ -26,6 +31,30 @@ from .loader import load_canon
 ParallelRow = Tuple[str, int, int, Dict[str, str]]  # book_code, chapter, verse, texts_by_translation
 
 
+@lru_cache(maxsize=64)
+def _canon_codes(codes: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Uppercase a tuple of translation codes, memoized.
+
+    Interactive sessions pass the same few code sets over and over;
+    the cache turns the per-call uppercase pass into a dict hit, and
+    the tuple result stays hashable for downstream memoization.
+    """
+    return tuple(c.upper() for c in codes)
+
+
+# Compiled once at import; parsing a reference is then a single match
+# instead of an rindex/split chain re-run on every call.
+_REF_RE = re.compile(
+    r"^\s*(?P<book>.+?)\s+(?P<chapter>\d+)\s*:\s*(?P<v_start>\d+)"
+    r"(?:\s*-\s*(?P<v_end>\d+))?\s*$"
+)
+
+# canon.json is immutable at runtime, so the book lookup is built once
+# per process instead of per call.
+_book_lookup_cache: Optional[Dict[str, int]] = None
+
+
 def _build_book_lookup(canon: Dict[int, Dict[str, Any]]) -> Dict[str, int]:
     """
     Build a mapping from various book strings to book_num.
@@ -34,100 +63,126 @@ def _build_book_lookup(canon: Dict[int, Dict[str, Any]]) -> Dict[str, int]:
     - 3-letter code (GEN)
     - full name (Genesis)
     - lowercase variants
+
+    The result is cached for the life of the process.
     """
+    global _book_lookup_cache
+    if _book_lookup_cache is not None:
+        return _book_lookup_cache
+
     lookup: Dict[str, int] = {}
     for num, meta in canon.items():
         code = meta["code"]
         name = meta["name"]
         for key in {code, code.lower(), name, name.lower()}:
             lookup[key] = num
+
+    _book_lookup_cache = lookup
     return lookup
 
 
+# Reverse canon mapping for display (GEN -> Genesis), built once per
+# process like the book lookup above.
+_code_to_name_cache: Optional[Dict[str, str]] = None
+
+
+def _code_to_name() -> Dict[str, str]:
+    """Map canonical book codes to display names, cached per process."""
+    global _code_to_name_cache
+    if _code_to_name_cache is None:
+        _code_to_name_cache = {
+            meta["code"]: meta.get("name", meta["code"])
+            for meta in load_canon().values()
+        }
+    return _code_to_name_cache
+
+
+# SQL text per placeholder width. Returning the same string object for
+# a given width also means sqlite3's per-connection statement cache hits
+# without even comparing text; the power-of-two padding keeps the number
+# of distinct widths (and thus cached plans) small.
+_PARALLEL_SQL_CACHE: Dict[int, str] = {}
+
+
+def _parallel_sql(width: int) -> str:
+    """Parallel-fetch SELECT with `width` IN-list placeholders, cached."""
+    sql = _PARALLEL_SQL_CACHE.get(width)
+    if sql is None:
+        placeholders = ", ".join("?" for _ in range(width))
+        # book_code and chapter are omitted from the SELECT: the caller
+        # already knows both from the parsed reference, and narrower rows
+        # mean fewer bytes copied out per fetch.
+        sql = f"""
+            SELECT translation_code,
+                   verse,
+                   text
+            FROM verses_normalized
+            WHERE translation_code IN ({placeholders})
+              AND book_num = ?
+              AND chapter = ?
+              AND verse BETWEEN ? AND ?
+            ORDER BY verse, translation_code;
+        """
+        _PARALLEL_SQL_CACHE[width] = sql
+    return sql
+
+
 def _parse_reference_range(ref: str) -> Optional[Tuple[str, int, int, int]]:
     """
     Parse a reference like 'John 3:16-18' or 'Gen 1:1' into:
 
         (book_str, chapter, verse_start, verse_end)
     """
-    s = ref.strip()
-    if not s:
+    if not ref.strip():
         warn("Empty reference string.")
         return None
 
-    try:
-        space_idx = s.rindex(" ")
-    except ValueError:
-        warn(f"Could not split book and chapter/verse from reference: {ref!r}")
+    m = _REF_RE.match(ref)
+    if m is None:
+        warn(f"Could not parse reference (expected 'Book C:V' or 'Book C:V1-V2'): {ref!r}")
         return None
 
-    book_str = s[:space_idx].strip()
-    cv_str = s[space_idx + 1 :].strip()
-
-    if ":" not in cv_str:
-        warn(f"Reference missing ':' in chapter:verse part: {ref!r}")
-        return None
-
-    chap_str, verse_part = cv_str.split(":", 1)
-
-    try:
-        chapter = int(chap_str.strip())
-    except ValueError:
-        warn(f"Non-integer chapter in reference: {ref!r}")
-        return None
-
-    verse_part = verse_part.strip()
-    if "-" in verse_part:
-        start_str, end_str = verse_part.split("-", 1)
-        try:
-            v_start = int(start_str.strip())
-            v_end = int(end_str.strip())
-        except ValueError:
-            warn(f"Invalid verse range in reference: {ref!r}")
-            return None
-    else:
-        try:
-            v_start = v_end = int(verse_part)
-        except ValueError:
-            warn(f"Invalid verse number in reference: {ref!r}")
-            return None
+    book_str = m.group("book")
+    chapter = int(m.group("chapter"))
+    v_start = int(m.group("v_start"))
+    v_end = int(m.group("v_end")) if m.group("v_end") else v_start
 
     return book_str, chapter, v_start, v_end
 
 
-def get_parallel_verses(ref: str, translation_codes: List[str]) -> List[ParallelRow]:
+def iter_parallel_verses(
+    ref: str,
+    translation_codes: List[str],
+    conn: Optional[sqlite3.Connection] = None,
+) -> Iterator[ParallelRow]:
     """
-    Fetch verses for a reference across multiple translations.
+    Generator variant of get_parallel_verses.
 
-    Parameters
-    ----------
-    ref:
-        Reference string like 'John 3:16' or 'John 3:16-18'.
-    translation_codes:
-        List of translation codes, e.g. ['KJV', 'BSB', 'ASV'].
+    Yields ParallelRow tuples one verse at a time while the cursor is still
+    producing rows, so report writers can stream output without holding the
+    whole range (or the whole report) in memory.
 
-    Returns
-    -------
-    List[ParallelRow]:
-        (book_code, chapter, verse, { code: text, ... })
+    The cursor is ordered by (verse, translation_code), so rows for a verse
+    are grouped with itertools.groupby and verses missing from every
+    translation are filled in as the gap is crossed.
     """
-    translation_codes = [c.upper() for c in translation_codes]
+    translation_codes = _canon_codes(tuple(translation_codes))
     info(f"=== PARALLEL === ref={ref!r}, codes={translation_codes!r}")
 
     if not translation_codes:
         warn("No translation codes provided; nothing to do.")
-        return []
+        return
 
     parsed = _parse_reference_range(ref)
     if parsed is None:
-        return []
+        return
 
     book_str, chapter, v_start, v_end = parsed
 
     canon = load_canon()
     if not canon:
         warn("Canon mapping is empty; cannot resolve book in reference.")
-        return []
+        return
 
     book_lookup = _build_book_lookup(canon)
 
@@ -139,57 +194,97 @@ def get_parallel_verses(ref: str, translation_codes: List[str]) -> List[Parallel
 
     if num is None:
         warn(f"Could not resolve book name {book_str!r} using canon.json.")
-        return []
+        return
 
     book_meta = canon[num]
     book_code = book_meta["code"]
 
-    # Prepare query
-    placeholders = ", ".join("?" for _ in translation_codes)
-    sql = f"""
-        SELECT translation_code,
-               book_code,
-               chapter,
-               verse,
-               text
-        FROM verses_normalized
-        WHERE translation_code IN ({placeholders})
-          AND book_num = ?
-          AND chapter = ?
-          AND verse BETWEEN ? AND ?
-        ORDER BY verse, translation_code;
-    """
+    # Prepare query. All translations are fetched in one grouped statement
+    # (translation_code IN (...)) — one round-trip regardless of how many
+    # codes are requested; rows are bucketed per verse as they stream in.
+    # The IN list is padded to the next power of two with an impossible
+    # code so the SQL text stays stable and its prepared statement is
+    # reused across calls with different translation counts.
+    width = 1
+    while width < len(translation_codes):
+        width <<= 1
+    padded_codes = translation_codes + ("\x00",) * (width - len(translation_codes))
+    sql = _parallel_sql(width)
 
     try:
-        with get_conn(readonly=True) as conn:
-            cur = conn.execute(
-                sql,
-                (*translation_codes, num, chapter, v_start, v_end),
-            )
-            rows = cur.fetchall()
+        if conn is None:
+            # Shared per-thread read-only connection: repeated parallel
+            # lookups skip the sqlite3_open + PRAGMA setup and keep the
+            # page and prepared-statement caches warm across calls.
+            conn = get_shared_ro_conn()
+        # Plain tuples for this cursor: the rows are unpacked positionally
+        # below, so sqlite3.Row's name-lookup machinery is pure overhead.
+        cur = conn.cursor()
+        cur.row_factory = None
+        cur.execute(
+            sql,
+            (*padded_codes, num, chapter, v_start, v_end),
+        )
+
+        first = cur.fetchone()
+        if first is None:
+            warn("No verses found for the requested reference in the given translations.")
+            return
+
+        # fetchmany keeps memory flat on wide ranges while still crossing
+        # the C boundary once per 256 rows instead of once per row.
+        def _chunks() -> Iterator[Tuple[str, int, str]]:
+            fetch = cur.fetchmany
+            while True:
+                chunk = fetch(256)
+                if not chunk:
+                    return
+                yield from chunk
+
+        next_verse = v_start
+        for verse, group in groupby(chain([first], _chunks()), key=itemgetter(1)):
+            # Fill verses missing from every requested translation.
+            while next_verse < verse:
+                yield (book_code, chapter, next_verse, {})
+                next_verse += 1
+            texts = {t_code: text for t_code, _v, text in group}
+            yield (book_code, chapter, verse, texts)
+            next_verse = verse + 1
+        while next_verse <= v_end:
+            yield (book_code, chapter, next_verse, {})
+            next_verse += 1
     except sqlite3.Error as e:
         warn(f"Database error during parallel retrieval: {e}")
-        return []
+        return
 
-    if not rows:
-        warn("No verses found for the requested reference in the given translations.")
-        return []
 
-    # Build map: verse -> { code: text }
-    verse_map = {}
-    for t_code, b_code, chap, verse, text in rows:
-        if chap != chapter:
-            continue
-        mapping = verse_map.setdefault(verse, {})
-        mapping[t_code] = text
+def get_parallel_verses(
+    ref: str,
+    translation_codes: List[str],
+    conn: Optional[sqlite3.Connection] = None,
+) -> List[ParallelRow]:
+    """
+    Fetch verses for a reference across multiple translations.
 
-    # Convert to ordered list of ParallelRow
-    parallel_rows: List[ParallelRow] = []
-    for verse in range(v_start, v_end + 1):
-        texts = verse_map.get(verse, {})
-        parallel_rows.append((book_code, chapter, verse, texts))
+    Materializing wrapper around iter_parallel_verses, kept for callers
+    that index into the result (print_parallel, compare).
 
-    return parallel_rows
+    Parameters
+    ----------
+    ref:
+        Reference string like 'John 3:16' or 'John 3:16-18'.
+    translation_codes:
+        List of translation codes, e.g. ['KJV', 'BSB', 'ASV'].
+    conn:
+        Optional already-open connection to reuse; if None, a fresh
+        read-only connection is opened and closed for this call.
+
+    Returns
+    -------
+    List[ParallelRow]:
+        (book_code, chapter, verse, { code: text, ... })
+    """
+    return list(iter_parallel_verses(ref, translation_codes, conn=conn))
 
 
 def print_parallel(ref: str, translation_codes: List[str], rows: List[ParallelRow]) -> None:
@@ -209,21 +304,16 @@ def print_parallel(ref: str, translation_codes: List[str], rows: List[ParallelRo
         warn("No parallel rows to display.")
         return
 
-    translation_codes = [c.upper() for c in translation_codes]
+    translation_codes = _canon_codes(tuple(translation_codes))
 
-    # Try to get a nice book name for the header line
-    canon = load_canon()
+    # Nice book name for the header line: O(1) probe of the cached
+    # reverse map instead of a canon scan per call.
     book_code = rows[0][0]
-    book_name = book_code
-    if canon:
-        for meta in canon.values():
-            if meta.get("code") == book_code:
-                book_name = meta.get("name", book_code)
-                break
+    book_name = _code_to_name().get(book_code, book_code)
 
+    missing = "(missing in this translation)"
     for book_code, chapter, verse, texts in rows:
         print(f"{book_name} {chapter}:{verse}")
         for code in translation_codes:
-            text = texts.get(code, "(missing in this translation)")
-            print(f"  [{code}] {text}")
+            print(f"  [{code}] {texts.get(code, missing)}")
         print()
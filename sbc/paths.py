@@ -11,6 +11,11 @@ SCHEMA_DIR = PROJECT_ROOT / "schema"
 DATA_DIR = PROJECT_ROOT / "data"
 
 
+# ensure_basic_dirs is called on every CLI command; once it has
+# succeeded there is nothing left to do for the life of the process.
+_dirs_ensured = False
+
+
 def ensure_basic_dirs() -> None:
     """
     Ensure essential directories exist:
@@ -18,8 +23,16 @@ def ensure_basic_dirs() -> None:
     - reports/
     - logs/ (future)
     - schema/
+
+    No-op after the first successful run in a process.
     """
-    (PROJECT_ROOT / "data").mkdir(exist_ok=True)
-    (PROJECT_ROOT / "reports").mkdir(exist_ok=True)
-    (PROJECT_ROOT / "logs").mkdir(exist_ok=True)
-    (PROJECT_ROOT / "schema").mkdir(exist_ok=True)
+    global _dirs_ensured
+    if _dirs_ensured:
+        return
+
+    for sub in ("data", "reports", "logs", "schema"):
+        path = PROJECT_ROOT / sub
+        if not path.is_dir():
+            path.mkdir(exist_ok=True)
+
+    _dirs_ensured = True
@@ -1,19 +1,35 @@
 """
-PDF generation scaffolding.
+PDF generation for the Study Bible Compendium.
 
-Currently this module writes plain-text files with `.txt` extension
-as a stand-in for real PDF generation. Once a PDF library is chosen
-(e.g., ReportLab), the functions here can be upgraded without changing
-the surrounding code.
+When ReportLab is installed, the report functions emit real `.pdf`
+files. Without it they fall back to the original plain-text writers
+(`.txt` extension), so the pipeline keeps working in minimal
+environments.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
+from typing import Iterable, List, Tuple, Optional, Dict
+from xml.sax.saxutils import escape
 
 from .util import info
 
+try:
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    reportlab_available = True
+except ImportError:  # pragma: no cover
+    reportlab_available = False
+
+
+@lru_cache(maxsize=1)
+def _styles():
+    """Shared ReportLab stylesheet, built once per process."""
+    return getSampleStyleSheet()
+
 # Keep this type in sync with sbc.search.VerseRow / sbc.context.VerseRow
 VerseRow = Tuple[str, int, str, int, int, str]
 
@@ -23,32 +39,61 @@ ParallelRow = Tuple[str, int, int, Dict[str, str]]
 
 def generate_basic_report(output_path: Path, title: str, body: str) -> None:
     """
-    Placeholder function for generating a minimal report.
+    Generate a minimal report: a title followed by body text.
 
-    CURRENT STATUS:
-    ---------------
-    Writes a plain-text file with `.txt` extension.
+    Emits a real PDF when ReportLab is available; otherwise falls back
+    to the legacy plain-text stub.
     """
-    output_path = output_path.with_suffix(".txt")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    info(f"Writing BASIC REPORT (stub) to: {output_path}")
-    content = f"{title}\n{'=' * len(title)}\n\n{body}\n"
-    output_path.write_text(content, encoding="utf-8")
+    if not reportlab_available:
+        output_path = output_path.with_suffix(".txt")
+        info(f"Writing BASIC REPORT (stub) to: {output_path}")
+        content = f"{title}\n{'=' * len(title)}\n\n{body}\n"
+        output_path.write_text(content, encoding="utf-8")
+        return
+
+    output_path = output_path.with_suffix(".pdf")
+    info(f"Writing BASIC REPORT to: {output_path}")
+    styles = _styles()
+    story = [Paragraph(escape(title), styles["Title"]), Spacer(1, 12)]
+    for line in body.splitlines():
+        if line.strip():
+            story.append(Paragraph(escape(line), styles["BodyText"]))
+        else:
+            story.append(Spacer(1, 6))
+    doc = SimpleDocTemplate(str(output_path), pagesize=LETTER, title=title)
+    doc.build(story)
 
 
-def _format_verse_rows(rows: List[VerseRow]) -> str:
+def _iter_verse_lines(rows: Iterable[VerseRow]) -> Iterable[str]:
     """
-    Format a list of verses into a human-readable block of text.
+    Yield one formatted text line per verse:
 
-    Each line looks like:
         BookCode 3:16  {text}
     """
-    lines: List[str] = []
     for code, book_num, book_code, chapter, verse, text in rows:
-        # We don't have book names here (only book_code), which is fine for now.
-        lines.append(f"{book_code} {chapter}:{verse}  {text}")
-    return "\n".join(lines)
+        yield f"{book_code} {chapter}:{verse}  {text}"
+
+
+def _format_verse_rows(rows: List[VerseRow]) -> str:
+    """
+    Format a list of verses into a human-readable block of text,
+    one `BookCode 3:16  {text}` line per verse.
+    """
+    # We don't have book names here (only book_code), which is fine for now.
+    return "\n".join(_iter_verse_lines(rows))
+
+
+def _append_verse_paragraphs(story: list, rows: List[VerseRow]) -> None:
+    """
+    Append one Paragraph flowable per verse to a ReportLab story.
+    """
+    style = _styles()["BodyText"]
+    for code, book_num, book_code, chapter, verse, text in rows:
+        story.append(
+            Paragraph(f"<b>{book_code} {chapter}:{verse}</b>  {escape(text)}", style)
+        )
 
 
 def generate_passage_report(
@@ -64,14 +109,14 @@ def generate_passage_report(
     Generate a passage-focused report with optional context and
     hermeneutical policy information in the header.
 
-    CURRENT STATUS:
-    ---------------
-    Writes a `.txt` file as a stand-in for a real PDF.
+    Emits a real PDF when ReportLab is available; otherwise falls back
+    to the legacy plain-text stub.
 
     Parameters
     ----------
     output_path:
-        Base path for the output file (will be forced to `.txt`).
+        Base path for the output file (extension becomes `.pdf`, or
+        `.txt` on the fallback path).
     ref:
         Reference string used for the passage (e.g. 'John 3:16-18').
     translation_code:
@@ -86,100 +131,150 @@ def generate_passage_report(
         Full checksum from the hermeneutical policy (or None if missing).
     """
     translation_code = translation_code.upper()
-    output_path = output_path.with_suffix(".txt")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # --- Header ---
     title = f"Passage Report – {ref} ({translation_code})"
 
-    header_lines: List[str] = []
-    header_lines.append(title)
-    header_lines.append("=" * len(title))
-    header_lines.append("")
-    header_lines.append(f"Reference : {ref}")
-    header_lines.append(f"Translation: {translation_code}")
-
     if policy_version and policy_checksum:
-        header_lines.append(
+        policy_line = (
             f"Hermeneutical Policy: v{policy_version} "
             f"(checksum {policy_checksum[:12]}...)"
         )
     else:
-        header_lines.append("Hermeneutical Policy: NOT INITIALIZED")
-
-    header_lines.append("")
-
-    # --- Passage section ---
-    body_lines: List[str] = []
-    body_lines.append("[Passage]")
+        policy_line = "Hermeneutical Policy: NOT INITIALIZED"
+
+    if not reportlab_available:
+        output_path = output_path.with_suffix(".txt")
+
+        # Stream sections straight to the file instead of building the
+        # whole report as one joined string first; output bytes are
+        # identical to the old join-based writer.
+        info(f"Writing PASSAGE REPORT (stub) to: {output_path}")
+        with output_path.open("w", encoding="utf-8") as fh:
+            fh.write(
+                f"{title}\n{'=' * len(title)}\n\n"
+                f"Reference : {ref}\n"
+                f"Translation: {translation_code}\n"
+                f"{policy_line}\n\n\n"
+            )
+
+            # --- Passage section ---
+            fh.write("[Passage]\n")
+            if passage_rows:
+                fh.writelines(f"{line}\n" for line in _iter_verse_lines(passage_rows))
+            else:
+                fh.write("(No verses found for this passage.)\n")
+
+            # --- Optional context section ---
+            if context_rows is not None:
+                fh.write("\n[Context Window]\n")
+                if context_rows:
+                    fh.writelines(f"{line}\n" for line in _iter_verse_lines(context_rows))
+                else:
+                    fh.write("(No context verses found.)\n")
+        return
+
+    output_path = output_path.with_suffix(".pdf")
+    info(f"Writing PASSAGE REPORT to: {output_path}")
+    styles = _styles()
+
+    story = [Paragraph(escape(title), styles["Title"])]
+    story.append(Paragraph(f"Reference: {escape(ref)}", styles["Normal"]))
+    story.append(Paragraph(f"Translation: {escape(translation_code)}", styles["Normal"]))
+    story.append(Paragraph(escape(policy_line), styles["Normal"]))
+    story.append(Spacer(1, 12))
+
+    story.append(Paragraph("Passage", styles["Heading2"]))
     if passage_rows:
-        body_lines.append(_format_verse_rows(passage_rows))
+        _append_verse_paragraphs(story, passage_rows)
     else:
-        body_lines.append("(No verses found for this passage.)")
+        story.append(Paragraph("(No verses found for this passage.)", styles["BodyText"]))
 
-    # --- Optional context section ---
     if context_rows is not None:
-        body_lines.append("")
-        body_lines.append("[Context Window]")
+        story.append(Spacer(1, 12))
+        story.append(Paragraph("Context Window", styles["Heading2"]))
         if context_rows:
-            body_lines.append(_format_verse_rows(context_rows))
+            _append_verse_paragraphs(story, context_rows)
         else:
-            body_lines.append("(No context verses found.)")
+            story.append(Paragraph("(No context verses found.)", styles["BodyText"]))
 
-    content = "\n".join(header_lines + [""] + body_lines) + "\n"
-
-    info(f"Writing PASSAGE REPORT (stub) to: {output_path}")
-    output_path.write_text(content, encoding="utf-8")
+    doc = SimpleDocTemplate(str(output_path), pagesize=LETTER, title=title)
+    doc.build(story)
 
 
 def generate_parallel_report(
     output_path: Path,
     ref: str,
     translation_codes: List[str],
-    rows: List[ParallelRow],
+    rows: Iterable[ParallelRow],
     policy_version: Optional[str],
     policy_checksum: Optional[str],
 ) -> None:
     """
     Generate a parallel translation report for a reference.
 
-    CURRENT STATUS:
-    ---------------
-    Writes a `.txt` file; easy to upgrade to real PDF later.
+    `rows` may be any iterable (including the iter_parallel_verses
+    generator); rows are consumed one at a time as they arrive rather
+    than requiring a materialized list.
+
+    Emits a real PDF when ReportLab is available; otherwise falls back
+    to the legacy plain-text stub.
     """
     translation_codes = [c.upper() for c in translation_codes]
-    output_path = output_path.with_suffix(".txt")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     title = f"Parallel Translation Report – {ref}"
 
-    header_lines: List[str] = []
-    header_lines.append(title)
-    header_lines.append("=" * len(title))
-    header_lines.append("")
-    header_lines.append(f"Reference : {ref}")
-    header_lines.append("Translations: " + ", ".join(translation_codes))
-
     if policy_version and policy_checksum:
-        header_lines.append(
+        policy_line = (
             f"Hermeneutical Policy: v{policy_version} "
             f"(checksum {policy_checksum[:12]}...)"
         )
     else:
-        header_lines.append("Hermeneutical Policy: NOT INITIALIZED")
-
-    header_lines.append("")
-
-    body_lines: List[str] = []
+        policy_line = "Hermeneutical Policy: NOT INITIALIZED"
+
+    if not reportlab_available:
+        output_path = output_path.with_suffix(".txt")
+
+        header_lines: List[str] = []
+        header_lines.append(title)
+        header_lines.append("=" * len(title))
+        header_lines.append("")
+        header_lines.append(f"Reference : {ref}")
+        header_lines.append("Translations: " + ", ".join(translation_codes))
+        header_lines.append(policy_line)
+        header_lines.append("")
+
+        info(f"Writing PARALLEL REPORT (stub) to: {output_path}")
+        with output_path.open("w", encoding="utf-8") as fh:
+            fh.write("\n".join(header_lines) + "\n\n")
+            for book_code, chapter, verse, texts in rows:
+                fh.write(f"{book_code} {chapter}:{verse}\n")
+                for code in translation_codes:
+                    text = texts.get(code, "(missing in this translation)")
+                    fh.write(f"  [{code}] {text}\n")
+                fh.write("\n")
+        return
+
+    output_path = output_path.with_suffix(".pdf")
+    info(f"Writing PARALLEL REPORT to: {output_path}")
+    styles = _styles()
+    body_style = styles["BodyText"]
+
+    story = [Paragraph(escape(title), styles["Title"])]
+    story.append(Paragraph(f"Reference: {escape(ref)}", styles["Normal"]))
+    story.append(
+        Paragraph("Translations: " + escape(", ".join(translation_codes)), styles["Normal"])
+    )
+    story.append(Paragraph(escape(policy_line), styles["Normal"]))
+    story.append(Spacer(1, 12))
 
     for book_code, chapter, verse, texts in rows:
-        body_lines.append(f"{book_code} {chapter}:{verse}")
+        story.append(Paragraph(f"<b>{book_code} {chapter}:{verse}</b>", styles["Heading4"]))
         for code in translation_codes:
             text = texts.get(code, "(missing in this translation)")
-            body_lines.append(f"  [{code}] {text}")
-        body_lines.append("")
-
-    content = "\n".join(header_lines + [""] + body_lines) + "\n"
+            story.append(Paragraph(f"[{code}] {escape(text)}", body_style))
+        story.append(Spacer(1, 6))
 
-    info(f"Writing PARALLEL REPORT (stub) to: {output_path}")
-    output_path.write_text(content, encoding="utf-8")
+    doc = SimpleDocTemplate(str(output_path), pagesize=LETTER, title=title)
+    doc.build(story)
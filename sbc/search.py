@@ -15,8 +15,11 @@ This module now provides:
 
 from __future__ import annotations
 
-from typing import List, Tuple, Optional, Dict, Any
+from contextlib import nullcontext
+from typing import Iterator, List, Tuple, Optional, Dict, Any
+import re
 import sqlite3
+import sys
 
 from .db import get_conn
 from .util import info, warn
@@ -27,34 +30,286 @@ from .loader import load_canon
 VerseRow = Tuple[str, int, str, int, int, str]
 
 
+# Compiled once at import; parsing a reference is then a single match
+# instead of an rindex/split chain re-run on every call.
+_REF_RE = re.compile(
+    r"^\s*(?P<book>.+?)\s+(?P<chapter>\d+)\s*:\s*(?P<v_start>\d+)"
+    r"(?:\s*-\s*(?P<v_end>\d+))?\s*$"
+)
+
+# Common alternate abbreviations seen in references, keyed by canonical
+# code. Every key in the lookup below is stored normalized (lowercase,
+# no dots/spaces, roman ordinals -> digits), so these only need to be
+# listed in their familiar written form.
+_BOOK_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "GEN": ("Gn", "Ge"),
+    "EXO": ("Ex", "Exod"),
+    "LEV": ("Lv",),
+    "NUM": ("Nm", "Nb"),
+    "DEU": ("Dt", "Deut"),
+    "JOS": ("Josh",),
+    "JDG": ("Jgs", "Judg"),
+    "RUT": ("Ru",),
+    "1SA": ("1 Sam", "1 Sm"),
+    "2SA": ("2 Sam", "2 Sm"),
+    "1KI": ("1 Kgs", "1 Kings"),
+    "2KI": ("2 Kgs", "2 Kings"),
+    "1CH": ("1 Chr", "1 Chron"),
+    "2CH": ("2 Chr", "2 Chron"),
+    "NEH": ("Ne",),
+    "EST": ("Esth",),
+    "PSA": ("Ps", "Pss", "Psalm"),
+    "PRO": ("Prov", "Prv"),
+    "ECC": ("Eccl", "Qoheleth"),
+    "SNG": ("Song", "Song of Songs", "Song of Solomon", "Canticles"),
+    "ISA": ("Is",),
+    "EZK": ("Ezek", "Eze"),
+    "DAN": ("Dn",),
+    "OBA": ("Obad", "Ob"),
+    "MIC": ("Mi",),
+    "NAM": ("Nah",),
+    "ZEP": ("Zeph",),
+    "ZEC": ("Zech",),
+    "MAT": ("Mt", "Matt"),
+    "MRK": ("Mk",),
+    "LUK": ("Lk",),
+    "JHN": ("Jn",),
+    "ROM": ("Rm",),
+    "1CO": ("1 Cor",),
+    "2CO": ("2 Cor",),
+    "PHP": ("Phil",),
+    "1TH": ("1 Thess", "1 Thes"),
+    "2TH": ("2 Thess", "2 Thes"),
+    "1TI": ("1 Tim",),
+    "2TI": ("2 Tim",),
+    "PHM": ("Phlm",),
+    "JAS": ("Jas",),
+    "1PE": ("1 Pet", "1 Pt"),
+    "2PE": ("2 Pet", "2 Pt"),
+    "1JN": ("1 John",),
+    "2JN": ("2 John",),
+    "3JN": ("3 John",),
+    "REV": ("Rv", "Apocalypse"),
+}
+
+# Leading roman ordinal ("I Cor", "II Kings") -> digit form.
+_ROMAN_PREFIX_RE = re.compile(r"^(iii|ii|i)\s+")
+_WS_RE = re.compile(r"\s+")
+
+
+def _normalize_book(book_str: str) -> str:
+    """
+    Normalize a book string for lookup: lowercase, dots stripped,
+    leading roman ordinal converted to a digit, all whitespace removed
+    ('I Cor.' -> '1cor').
+    """
+    s = book_str.strip().lower().replace(".", "")
+    s = _ROMAN_PREFIX_RE.sub(lambda m: f"{len(m.group(1))} ", s)
+    return _WS_RE.sub("", s)
+
+
+# canon.json is immutable at runtime, so the book lookup is built once
+# per process instead of per call.
+_book_lookup_cache: Optional[Dict[str, int]] = None
+
+
 def _build_book_lookup(canon: Dict[int, Dict[str, Any]]) -> Dict[str, int]:
     """
-    Build a mapping from various book strings to book_num.
+    Build a mapping from normalized book strings to book_num.
+
+    Keys cover the 3-letter code (GEN), the full name (Genesis), and the
+    common abbreviations in _BOOK_ALIASES, all run through
+    _normalize_book so resolution is a single dict probe.
 
-    Keys include:
-    - 3-letter code (GEN)
-    - full name (Genesis)
-    - lowercase variants
+    The result is cached for the life of the process.
     """
+    global _book_lookup_cache
+    if _book_lookup_cache is not None:
+        return _book_lookup_cache
+
     lookup: Dict[str, int] = {}
     for num, meta in canon.items():
         code = meta["code"]
-        name = meta["name"]
-
-        for key in {code, code.lower(), name, name.lower()}:
-            lookup[key] = num
+        for key in (code, meta["name"], *_BOOK_ALIASES.get(code, ())):
+            lookup[_normalize_book(key)] = num
 
+    _book_lookup_cache = lookup
     return lookup
 
 
+# SQL texts as module constants: sqlite3's per-connection statement
+# cache keys on the exact string object, so handing it the same constant
+# every call guarantees a cache hit (no re-prepare) on the pooled
+# read-only connections. Same convention as sbc.core_passages.
+_FTS_SEARCH_ONE_SQL = """
+    SELECT v.translation_code,
+           v.book_num,
+           v.book_code,
+           v.chapter,
+           v.verse,
+           v.text
+    FROM verses_fts f
+    JOIN verses_normalized v ON v.id = f.rowid
+    WHERE verses_fts MATCH ?
+      AND v.translation_code = ?
+    ORDER BY v.translation_code, v.book_num, v.chapter, v.verse
+    LIMIT ?;
+"""
+
+_FTS_SEARCH_ALL_SQL = """
+    SELECT v.translation_code,
+           v.book_num,
+           v.book_code,
+           v.chapter,
+           v.verse,
+           v.text
+    FROM verses_fts f
+    JOIN verses_normalized v ON v.id = f.rowid
+    WHERE verses_fts MATCH ?
+    ORDER BY v.translation_code, v.book_num, v.chapter, v.verse
+    LIMIT ?;
+"""
+
+_LIKE_SEARCH_ONE_SQL = """
+    SELECT translation_code,
+           book_num,
+           book_code,
+           chapter,
+           verse,
+           text
+    FROM verses_normalized
+    WHERE translation_code = ?
+      AND text LIKE ?
+    ORDER BY translation_code, book_num, chapter, verse
+    LIMIT ?;
+"""
+
+_LIKE_SEARCH_ALL_SQL = """
+    SELECT translation_code,
+           book_num,
+           book_code,
+           chapter,
+           verse,
+           text
+    FROM verses_normalized
+    WHERE text LIKE ?
+    ORDER BY translation_code, book_num, chapter, verse
+    LIMIT ?;
+"""
+
+_PASSAGE_SQL = """
+    SELECT translation_code,
+           book_num,
+           book_code,
+           chapter,
+           verse,
+           text
+    FROM verses_normalized
+    WHERE translation_code = ?
+      AND book_num = ?
+      AND chapter = ?
+      AND verse BETWEEN ? AND ?
+    ORDER BY verse;
+"""
+
+
+def _execute_search_fts(
+    cur: sqlite3.Cursor,
+    fts_query: str,
+    translation_code: Optional[str],
+    limit: int,
+) -> None:
+    """
+    Run the indexed search via the verses_fts FTS5 table on `cur`
+    (see verse_schema.sql).
+    """
+    if translation_code:
+        cur.execute(_FTS_SEARCH_ONE_SQL, (fts_query, translation_code, limit))
+    else:
+        cur.execute(_FTS_SEARCH_ALL_SQL, (fts_query, limit))
+
+
+def _execute_search_like(
+    cur: sqlite3.Cursor,
+    query: str,
+    translation_code: Optional[str],
+    limit: int,
+) -> None:
+    """
+    Run the legacy LIKE '%query%' scan on `cur`, kept as a fallback for
+    databases that predate the verses_fts table.
+    """
+    if translation_code:
+        cur.execute(_LIKE_SEARCH_ONE_SQL, (translation_code, f"%{query}%", limit))
+    else:
+        cur.execute(_LIKE_SEARCH_ALL_SQL, (f"%{query}%", limit))
+
+
+def _iter_cursor(cur: sqlite3.Cursor) -> Iterator[VerseRow]:
+    """Drain a cursor in fetchmany chunks, yielding one row at a time."""
+    fetch = cur.fetchmany
+    while True:
+        chunk = fetch(256)
+        if not chunk:
+            return
+        yield from chunk
+
+
+def iter_search_verses(
+    query: str,
+    limit: int = 20,
+    translation_code: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
+) -> Iterator[VerseRow]:
+    """
+    Generator variant of search_verses.
+
+    Rows are yielded straight off the cursor (in fetchmany chunks), so
+    callers that print or write results sequentially never hold the
+    whole result set in memory.
+    """
+    query = query.strip()
+    if not query:
+        warn("Empty search query; returning no results.")
+        return
+
+    info(f"=== SEARCH === query={query!r}, limit={limit}, translation={translation_code!r}")
+
+    if translation_code:
+        translation_code = translation_code.upper()
+
+    # Quote the query as an FTS5 phrase so user input is never parsed as
+    # MATCH syntax (keeps the old substring-ish semantics).
+    fts_query = '"' + query.replace('"', '""') + '"'
+
+    try:
+        with nullcontext(conn) if conn is not None else get_conn(readonly=True) as conn:
+            cur = conn.cursor()
+            cur.row_factory = None
+            try:
+                _execute_search_fts(cur, fts_query, translation_code, limit)
+            except sqlite3.OperationalError:
+                # verses_fts missing (DB predates the FTS schema) or FTS5
+                # unavailable in this SQLite build: fall back to LIKE scan.
+                _execute_search_like(cur, query, translation_code, limit)
+            yield from _iter_cursor(cur)
+    except sqlite3.Error as e:
+        warn(f"Database error during search: {e}")
+        return
+
+
 def search_verses(
     query: str,
     limit: int = 20,
     translation_code: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> List[VerseRow]:
     """
     Perform a basic text search across verses.
 
+    Materializing wrapper around iter_search_verses, kept for callers
+    that need the whole result (length checks, slicing).
+
     Parameters
     ----------
     query:
@@ -63,62 +318,18 @@ def search_verses(
         Max number of verses to return.
     translation_code:
         Optional translation filter (e.g., 'KJV'). If None, searches all.
+    conn:
+        Optional already-open connection to reuse; if None, the pooled
+        read-only connection is used.
 
     Returns
     -------
     List of VerseRow tuples:
         (translation_code, book_num, book_code, chapter, verse, text)
     """
-    query = query.strip()
-    if not query:
-        warn("Empty search query; returning no results.")
-        return []
-
-    info(f"=== SEARCH === query={query!r}, limit={limit}, translation={translation_code!r}")
-
-    try:
-        with get_conn(readonly=True) as conn:
-            if translation_code:
-                translation_code = translation_code.upper()
-                cur = conn.execute(
-                    """
-                    SELECT translation_code,
-                           book_num,
-                           book_code,
-                           chapter,
-                           verse,
-                           text
-                    FROM verses_normalized
-                    WHERE translation_code = ?
-                      AND text LIKE ?
-                    ORDER BY translation_code, book_num, chapter, verse
-                    LIMIT ?;
-                    """,
-                    (translation_code, f"%{query}%", limit),
-                )
-            else:
-                cur = conn.execute(
-                    """
-                    SELECT translation_code,
-                           book_num,
-                           book_code,
-                           chapter,
-                           verse,
-                           text
-                    FROM verses_normalized
-                    WHERE text LIKE ?
-                    ORDER BY translation_code, book_num, chapter, verse
-                    LIMIT ?;
-                    """,
-                    (f"%{query}%", limit),
-                )
-            rows = cur.fetchall()
-    except sqlite3.Error as e:
-        warn(f"Database error during search: {e}")
-        return []
-
+    rows = list(iter_search_verses(query, limit, translation_code, conn=conn))
     info(f"Search returned {len(rows)} row(s).")
-    return [(r[0], r[1], r[2], r[3], r[4], r[5]) for r in rows]
+    return rows
 
 
 def _parse_reference(ref: str) -> Optional[tuple[str, int, int, int]]:
@@ -129,121 +340,106 @@ def _parse_reference(ref: str) -> Optional[tuple[str, int, int, int]]:
     -------
     (book_str, chapter, verse_start, verse_end) or None on failure.
     """
-    s = ref.strip()
-    if not s:
+    if not ref.strip():
         warn("Empty reference string.")
         return None
 
-    try:
-        space_idx = s.rindex(" ")
-    except ValueError:
-        warn(f"Could not split book and chapter/verse from reference: {ref!r}")
-        return None
-
-    book_str = s[:space_idx].strip()
-    cv_str = s[space_idx + 1 :].strip()
-
-    if ":" not in cv_str:
-        warn(f"Reference missing ':' in chapter:verse part: {ref!r}")
-        return None
-
-    chap_str, verse_part = cv_str.split(":", 1)
-    try:
-        chapter = int(chap_str)
-    except ValueError:
-        warn(f"Non-integer chapter in reference: {ref!r}")
+    m = _REF_RE.match(ref)
+    if m is None:
+        warn(f"Could not parse reference (expected 'Book C:V' or 'Book C:V1-V2'): {ref!r}")
         return None
 
-    verse_part = verse_part.strip()
-    if "-" in verse_part:
-        start_str, end_str = verse_part.split("-", 1)
-        try:
-            v_start = int(start_str.strip())
-            v_end = int(end_str.strip())
-        except ValueError:
-            warn(f"Invalid verse range in reference: {ref!r}")
-            return None
-    else:
-        try:
-            v_start = v_end = int(verse_part)
-        except ValueError:
-            warn(f"Invalid verse number in reference: {ref!r}")
-            return None
+    book_str = m.group("book")
+    chapter = int(m.group("chapter"))
+    v_start = int(m.group("v_start"))
+    v_end = int(m.group("v_end")) if m.group("v_end") else v_start
 
     return book_str, chapter, v_start, v_end
 
 
-def get_passage(ref: str, translation_code: str) -> List[VerseRow]:
+def iter_passage_verses(
+    ref: str,
+    translation_code: str,
+    conn: Optional[sqlite3.Connection] = None,
+) -> Iterator[VerseRow]:
     """
-    Fetch a passage like 'John 3:16-18' or 'Gen 1:1' from the `verses_normalized` table.
-
-    Parameters
-    ----------
-    ref:
-        Reference string, e.g. 'John 3:16-18', 'Gen 1:1'.
-    translation_code:
-        Translation code (e.g., 'KJV').
+    Generator variant of get_passage.
 
-    Returns
-    -------
-    List[VerseRow]:
-        (translation_code, book_num, book_code, chapter, verse, text)
+    Verses stream off the cursor as they are fetched, so a whole-chapter
+    passage never has to land in an intermediate list before a report
+    writer consumes it.
     """
     translation_code = translation_code.upper()
     info(f"=== PASSAGE === ref={ref!r}, translation={translation_code!r}")
 
     parsed = _parse_reference(ref)
     if parsed is None:
-        return []
+        return
 
     book_str, chapter, v_start, v_end = parsed
 
+    # Inverted range: BETWEEN can never match, so skip the B-tree
+    # descent (and the canon resolution) entirely.
+    if v_start > v_end:
+        warn(f"Inverted verse range {v_start}-{v_end}; returning no verses.")
+        return
+
     canon = load_canon()
     if not canon:
         warn("Canon mapping is empty; cannot resolve book in reference.")
-        return []
+        return
 
     book_lookup = _build_book_lookup(canon)
 
-    num = None
-    for key in (book_str, book_str.lower()):
-        if key in book_lookup:
-            num = book_lookup[key]
-            break
-
+    # Single probe on the normalized form; aliases and abbreviations
+    # were folded into the lookup keys at build time.
+    num = book_lookup.get(_normalize_book(book_str))
     if num is None:
         warn(f"Could not resolve book name {book_str!r} using canon.json.")
-        return []
-
-    book_meta = canon[num]
-    book_code = book_meta["code"]
+        return
 
     try:
-        with get_conn(readonly=True) as conn:
-            cur = conn.execute(
-                """
-                SELECT translation_code,
-                       book_num,
-                       book_code,
-                       chapter,
-                       verse,
-                       text
-                FROM verses_normalized
-                WHERE translation_code = ?
-                  AND book_num = ?
-                  AND chapter = ?
-                  AND verse BETWEEN ? AND ?
-                ORDER BY verse;
-                """,
+        with nullcontext(conn) if conn is not None else get_conn(readonly=True) as conn:
+            cur = conn.cursor()
+            cur.row_factory = None
+            cur.execute(
+                _PASSAGE_SQL,
                 (translation_code, num, chapter, v_start, v_end),
             )
-            rows = cur.fetchall()
+            yield from _iter_cursor(cur)
     except sqlite3.Error as e:
         warn(f"Database error during passage retrieval: {e}")
-        return []
+        return
+
+
+def get_passage(
+    ref: str,
+    translation_code: str,
+    conn: Optional[sqlite3.Connection] = None,
+) -> List[VerseRow]:
+    """
+    Fetch a passage like 'John 3:16-18' or 'Gen 1:1' from the `verses_normalized` table.
 
+    Materializing wrapper around iter_passage_verses, kept for callers
+    that index into the result.
+
+    Parameters
+    ----------
+    ref:
+        Reference string, e.g. 'John 3:16-18', 'Gen 1:1'.
+    translation_code:
+        Translation code (e.g., 'KJV').
+    conn:
+        Optional already-open connection to reuse (see search_verses).
+
+    Returns
+    -------
+    List[VerseRow]:
+        (translation_code, book_num, book_code, chapter, verse, text)
+    """
+    rows = list(iter_passage_verses(ref, translation_code, conn=conn))
     info(f"Passage query returned {len(rows)} row(s).")
-    return [(r[0], r[1], r[2], r[3], r[4], r[5]) for r in rows]
+    return rows
 
 
 def print_search_results(rows: List[VerseRow]) -> None:
@@ -254,18 +450,25 @@ def print_search_results(rows: List[VerseRow]) -> None:
         info("No results.")
         return
 
+    # One stdout write for the whole result set instead of three print()
+    # calls (lock + line-buffered flush each) per row; output bytes are
+    # identical to the old print-based loop.
     canon = load_canon()
     if not canon:
         warn("Canon mapping missing; printing without book names.")
-        for code, book_num, book_code, chapter, verse, text in rows:
-            print(f"[{code}] {book_code} {chapter}:{verse}")
-            print(f"    {text}")
-            print()
+        sys.stdout.write(
+            "".join(
+                f"[{code}] {book_code} {chapter}:{verse}\n    {text}\n\n"
+                for code, book_num, book_code, chapter, verse, text in rows
+            )
+        )
         return
 
-    for code, book_num, book_code, chapter, verse, text in rows:
-        meta = canon.get(book_num, {})
-        book_name = meta.get("name", book_code)
-        print(f"[{code}] {book_name} {chapter}:{verse}")
-        print(f"    {text}")
-        print()
+    canon_get = canon.get
+    sys.stdout.write(
+        "".join(
+            f"[{code}] {canon_get(book_num, {}).get('name', book_code)} "
+            f"{chapter}:{verse}\n    {text}\n\n"
+            for code, book_num, book_code, chapter, verse, text in rows
+        )
+    )
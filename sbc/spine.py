@@ -152,18 +152,40 @@ def _attach_verse_ids_to_verses() -> None:
             return
 
         info("Attaching verse_id to verses_normalized (joining on normalized_ref)...")
-        conn.execute(
-            """
-            UPDATE verses_normalized
-            SET verse_id = (
-                SELECT id
-                FROM canonical_verses cv
-                WHERE cv.normalized_ref = verses_normalized.normalized_ref
-            )
-            WHERE verse_id IS NULL;
-            """
-        )
-        conn.commit()
+        # canonical_verses.normalized_ref is UNIQUE, so its implicit
+        # index makes the match an index seek either way; UPDATE ... FROM
+        # (SQLite 3.33+) runs it as one join pass instead of a correlated
+        # subquery per row. The write lock is taken up front and the
+        # whole attach commits once.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            try:
+                conn.execute(
+                    """
+                    UPDATE verses_normalized AS v
+                    SET verse_id = cv.id
+                    FROM canonical_verses AS cv
+                    WHERE cv.normalized_ref = v.normalized_ref
+                      AND v.verse_id IS NULL;
+                    """
+                )
+            except sqlite3.OperationalError:
+                # Pre-3.33 SQLite: fall back to the correlated form.
+                conn.execute(
+                    """
+                    UPDATE verses_normalized
+                    SET verse_id = (
+                        SELECT id
+                        FROM canonical_verses cv
+                        WHERE cv.normalized_ref = verses_normalized.normalized_ref
+                    )
+                    WHERE verse_id IS NULL;
+                    """
+                )
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
 
         cur = conn.execute("SELECT COUNT(*) FROM verses_normalized WHERE verse_id IS NOT NULL;")
         (attached,) = cur.fetchone()
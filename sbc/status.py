@@ -4,21 +4,36 @@ Status and health-report helpers for the Study Bible Compendium.
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from typing import List, Tuple, Optional
 
 import sqlite3
+import sys
 
 from .db import get_conn
 from .paths import DB_PATH
 from .util import info, warn
 
 
-def get_policy_status() -> Optional[Tuple[str, str]]:
+# The policy row is locked once initialized, so a found (version, checksum)
+# pair is stable for the life of the process. A missing policy is not
+# cached — it may be initialized later in the same process.
+_policy_status_cache: Optional[Tuple[str, str]] = None
+
+
+def get_policy_status(conn: Optional[sqlite3.Connection] = None) -> Optional[Tuple[str, str]]:
     """
     Return (version, checksum) for the hermeneutical policy, or None if missing.
+
+    An already-open connection may be passed to avoid re-opening the DB.
+    The result is memoized per process once the policy is found.
     """
+    global _policy_status_cache
+    if _policy_status_cache is not None:
+        return _policy_status_cache
+
     try:
-        with get_conn(readonly=True) as conn:
+        with nullcontext(conn) if conn is not None else get_conn(readonly=True) as conn:
             cur = conn.execute(
                 """
                 SELECT version, checksum
@@ -32,16 +47,25 @@ def get_policy_status() -> Optional[Tuple[str, str]]:
 
     if not row:
         return None
-    return row[0], row[1]
+    _policy_status_cache = (row[0], row[1])
+    return _policy_status_cache
 
 
-def get_translation_stats() -> List[Tuple[str, int]]:
+def get_translation_stats(
+    conn: Optional[sqlite3.Connection] = None,
+) -> List[Tuple[str, int]]:
     """
     Return a list of (translation_code, verse_count) from the verses_normalized table.
+
+    An already-open connection may be passed to avoid re-acquiring one.
     """
     try:
-        with get_conn(readonly=True) as conn:
-            cur = conn.execute(
+        with nullcontext(conn) if conn is not None else get_conn(readonly=True) as conn:
+            # Tuple rows from the cursor are already the promised shape;
+            # COUNT(*) comes back as int, so no per-row rebuild.
+            cur = conn.cursor()
+            cur.row_factory = None
+            cur.execute(
                 """
                 SELECT translation_code, COUNT(*)
                 FROM verses_normalized
@@ -52,29 +76,26 @@ def get_translation_stats() -> List[Tuple[str, int]]:
             rows = cur.fetchall()
     except sqlite3.Error:
         return []
-    return [(r[0], int(r[1])) for r in rows]
+    return rows
 
 
-def get_translations() -> List[Tuple[str, str, str]]:
+def get_translations(
+    conn: Optional[sqlite3.Connection] = None,
+) -> List[Tuple[str, str, str]]:
     """
     Return a list of (code, name, language) from translations table.
 
     If the table does not exist, returns [].
+    An already-open connection may be passed to avoid re-acquiring one.
     """
     try:
-        with get_conn(readonly=True) as conn:
-            cur = conn.execute(
-                """
-                SELECT name
-                FROM sqlite_master
-                WHERE type='table'
-                  AND name='translations';
-                """
-            )
-            if not cur.fetchone():
-                return []
-
-            cur = conn.execute(
+        with nullcontext(conn) if conn is not None else get_conn(readonly=True) as conn:
+            # Query the table directly; a missing table surfaces as
+            # OperationalError below, so no sqlite_master probe (a
+            # master-table walk per status call) is needed first.
+            cur = conn.cursor()
+            cur.row_factory = None
+            cur.execute(
                 """
                 SELECT code, name, language
                 FROM translations
@@ -85,7 +106,26 @@ def get_translations() -> List[Tuple[str, str, str]]:
     except sqlite3.Error:
         return []
 
-    return [(r[0], r[1], r[2]) for r in rows]
+    return rows
+
+
+def get_status_bundle() -> Tuple[
+    Optional[Tuple[str, str]], List[Tuple[str, int]], List[Tuple[str, str, str]]
+]:
+    """
+    Return (policy, stats, registry) for the status report, running all
+    three queries back-to-back on one connection — one acquisition
+    instead of three, and a consistent snapshot of the three views.
+    """
+    try:
+        with get_conn(readonly=True) as conn:
+            return (
+                get_policy_status(conn=conn),
+                get_translation_stats(conn=conn),
+                get_translations(conn=conn),
+            )
+    except sqlite3.Error:
+        return None, [], []
 
 
 def print_status() -> None:
@@ -98,8 +138,9 @@ def print_status() -> None:
     """
     info(f"Database: {DB_PATH}")
 
+    policy, stats, registry = get_status_bundle()
+
     # Policy
-    policy = get_policy_status()
     if policy is None:
         warn("Policy: hermeneutical_policy table or row not found.")
     else:
@@ -107,19 +148,21 @@ def print_status() -> None:
         info(f"Policy: version={version}, checksum={checksum[:12]}...")
 
     # Translation stats from verses_normalized
-    stats = get_translation_stats()
+    # Both listings are emitted with one stdout write apiece instead of
+    # a print() (lock + flush) per line.
     if not stats:
         warn("No verse data found in `verses_normalized` table (or table missing).")
     else:
         info("Verse counts per translation (from verses_normalized table):")
-        for code, count in stats:
-            print(f"  - {code}: {count} verse(s)")
+        sys.stdout.write(
+            "".join(f"  - {code}: {count} verse(s)\n" for code, count in stats)
+        )
 
     # Translations registry
-    registry = get_translations()
     if not registry:
         warn("No translations recorded in `translations` table (or table missing).")
     else:
         info("Translations registry:")
-        for code, name, lang in registry:
-            print(f"  - {code} [{lang}]: {name}")
+        sys.stdout.write(
+            "".join(f"  - {code} [{lang}]: {name}\n" for code, name, lang in registry)
+        )
@@ -1,18 +1,42 @@
 """
 Utility functions for console output and common operations.
+
+Console output is backed by a module logger so messages can be filtered
+(set SBC_QUIET=1 to suppress info/ok chatter) and formatted lazily:
+pass %-style args (info("loaded %d rows", n)) and the string is only
+built when the message is actually emitted.
 """
 
+import logging
+import os
+import sys
+
+_OK_LEVEL = 25  # between INFO and WARNING
+
+# Keep the historical console prefixes ([info]/[warn]/[ok]) byte-for-byte.
+logging.addLevelName(logging.INFO, "info")
+logging.addLevelName(logging.WARNING, "warn")
+logging.addLevelName(_OK_LEVEL, "ok")
+
+_log = logging.getLogger("sbc")
+if not _log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    _log.addHandler(_handler)
+    _log.setLevel(logging.WARNING if os.environ.get("SBC_QUIET") else logging.INFO)
+    _log.propagate = False
+
 
-def info(msg: str) -> None:
+def info(msg: str, *args) -> None:
     """Print an info message."""
-    print(f"[info] {msg}")
+    _log.info(msg, *args)
 
 
-def warn(msg: str) -> None:
+def warn(msg: str, *args) -> None:
     """Print a warning message."""
-    print(f"[warn] {msg}")
+    _log.warning(msg, *args)
 
 
-def ok(msg: str) -> None:
+def ok(msg: str, *args) -> None:
     """Print a success message."""
-    print(f"[ok] {msg}")
+    _log.log(_OK_LEVEL, msg, *args)
@@ -4,8 +4,10 @@
 CREATE TABLE IF NOT EXISTS hermeneutical_policy (
     id              INTEGER PRIMARY KEY CHECK (id = 1),
     title           TEXT NOT NULL,
-    preface         TEXT NOT NULL,
-    body            TEXT NOT NULL,
+    -- preface/body are stored zlib-compressed (see cli/init_policy.py);
+    -- the checksum is always computed over the plaintext.
+    preface         BLOB NOT NULL,
+    body            BLOB NOT NULL,
     version         TEXT NOT NULL,
     effective_utc   TEXT NOT NULL,
     checksum        TEXT NOT NULL
@@ -25,9 +25,17 @@ CREATE TABLE IF NOT EXISTS verses_normalized (
 CREATE INDEX IF NOT EXISTS idx_verses_normref
     ON verses_normalized(normalized_ref);
 
--- Combined translation + reference lookup
-CREATE INDEX IF NOT EXISTS idx_verses_translation_ref
-    ON verses_normalized(translation_code, book_num, chapter, verse);
+-- Covering index for passage/context/parallel lookups
+-- (WHERE translation_code=? AND book_num=? AND chapter=? AND verse BETWEEN ? AND ?).
+-- Appending `book_code` and `text` lets SQLite answer the full
+-- six-column verse SELECTs with an index-only scan instead of a rowid
+-- fetch per matching verse. Replaces the old idx_verses_translation_ref,
+-- whose key was already covered by the UNIQUE constraint's implicit
+-- index, and the first covering attempt that omitted book_code.
+DROP INDEX IF EXISTS idx_verses_translation_ref;
+DROP INDEX IF EXISTS idx_verses_cover;
+CREATE INDEX IF NOT EXISTS idx_verses_cover2
+    ON verses_normalized(translation_code, book_num, chapter, verse, book_code, text);
 
 -- Basic text search index (for LIKE-based search)
 CREATE INDEX IF NOT EXISTS idx_verses_text
@@ -36,3 +44,30 @@ CREATE INDEX IF NOT EXISTS idx_verses_text
 -- Spine linkage index
 CREATE INDEX IF NOT EXISTS idx_verses_normalized_verse_id
     ON verses_normalized(verse_id);
+
+-- Full-text search over verse text.
+--
+-- External-content FTS5 table: the verse text is tokenized here but stored
+-- only in verses_normalized; the triggers below keep the index in sync.
+-- Backfill for pre-existing rows happens via
+--     INSERT INTO verses_fts(verses_fts) VALUES('rebuild');
+-- (run by `compendium init-schema`).
+CREATE VIRTUAL TABLE IF NOT EXISTS verses_fts USING fts5(
+    text,
+    content='verses_normalized',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS verses_fts_ai AFTER INSERT ON verses_normalized BEGIN
+    INSERT INTO verses_fts(rowid, text) VALUES (new.id, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS verses_fts_ad AFTER DELETE ON verses_normalized BEGIN
+    INSERT INTO verses_fts(verses_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS verses_fts_au AFTER UPDATE OF text ON verses_normalized BEGIN
+    INSERT INTO verses_fts(verses_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO verses_fts(rowid, text) VALUES (new.id, new.text);
+END;
@@ -13,10 +13,15 @@ Usage:
 
 import argparse
 import csv
+import os
 import re
 import sys
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 try:
     import openpyxl
@@ -25,11 +30,11 @@ except ImportError:
     sys.exit(1)
 
 
-# Book/chapter header pattern (e.g., "Genesis 1", "John 3")
-HEADER_PATTERN = re.compile(r"^([A-Za-z0-9\s]+?)\s+(\d+)$")
-
 # Verse split pattern (matches digit followed by text at word boundary)
 VERSE_SPLIT_PATTERN = re.compile(r"(\d+)(?=[A-Z])")
+# Bound method: one global load per call instead of an attribute lookup
+# through the Pattern object.
+_verse_split = VERSE_SPLIT_PATTERN.split
 
 # Common Bible book names
 BIBLE_BOOKS = {
@@ -50,18 +55,13 @@ BIBLE_BOOKS = {
 }
 
 
-def normalize_book_name(raw: str) -> Optional[str]:
-    """Normalize book name variations to canonical form."""
-    raw = raw.strip()
-    # Try exact match first
-    if raw in BIBLE_BOOKS:
-        return raw
-    # Try case-insensitive
-    for book in BIBLE_BOOKS:
-        if book.lower() == raw.lower():
-            return book
-    # Handle abbreviations (extend as needed)
-    abbrev_map = {
+# Lowercased lookup of canonical names plus common abbreviations
+# (extend the abbreviation block as needed). Built once so
+# normalize_book_name is a single dict probe instead of a scan.
+_CANON = {book.lower(): book for book in BIBLE_BOOKS}
+_CANON.update({
+    abbrev.lower(): full
+    for abbrev, full in {
         "Gen": "Genesis", "Exod": "Exodus", "Lev": "Leviticus",
         "Num": "Numbers", "Deut": "Deuteronomy", "Josh": "Joshua",
         "Judg": "Judges", "1Sam": "1 Samuel", "2Sam": "2 Samuel",
@@ -76,32 +76,40 @@ def normalize_book_name(raw: str) -> Optional[str]:
         "Jas": "James", "1Pet": "1 Peter", "2Pet": "2 Peter",
         "1Jn": "1 John", "2Jn": "2 John", "3Jn": "3 John",
         "Rev": "Revelation"
-    }
-    return abbrev_map.get(raw)
+    }.items()
+})
+
+
+def normalize_book_name(raw: str) -> Optional[str]:
+    """Normalize book name variations to canonical form."""
+    return _CANON.get(raw.strip().lower())
 
 
 def parse_book_chapter_header(text: str) -> Optional[Tuple[str, int]]:
     """
     Extract (book, chapter) from header line like "Genesis 1" or "1 Samuel 12".
     Returns None if line doesn't match pattern.
+
+    This runs on every non-empty row, nearly all of which are verse
+    text, so cheap string checks reject non-headers before any real
+    work: headers are short and end in a digit.
     """
-    match = HEADER_PATTERN.match(text.strip())
-    if not match:
+    s = text.strip()
+    if not s or len(s) > 40 or not s[-1].isdigit():
         return None
-    
-    raw_book = match.group(1).strip()
-    chapter_str = match.group(2)
-    
+
+    parts = s.rsplit(None, 1)
+    if len(parts) != 2:
+        return None
+    raw_book, chapter_str = parts
+    if not chapter_str.isdigit():
+        return None
+
     book = normalize_book_name(raw_book)
     if not book:
         return None
-    
-    try:
-        chapter = int(chapter_str)
-    except ValueError:
-        return None
-    
-    return (book, chapter)
+
+    return (book, int(chapter_str))
 
 
 def split_verses(text: str) -> list[Tuple[int, str]]:
@@ -111,23 +119,16 @@ def split_verses(text: str) -> list[Tuple[int, str]]:
     
     Returns list of (verse_number, verse_text) tuples.
     """
-    verses = []
-    parts = VERSE_SPLIT_PATTERN.split(text)
-    
-    # parts will be like: ['', '1', 'In the beginning...', '2', 'And the earth...']
-    i = 1
-    while i < len(parts):
-        if i + 1 < len(parts):
-            try:
-                verse_num = int(parts[i])
-                verse_text = parts[i + 1].strip()
-                if verse_text:
-                    verses.append((verse_num, verse_text))
-            except ValueError:
-                pass
-        i += 2
-    
-    return verses
+    # parts is like: ['', '1', 'In the beginning...', '2', 'And the earth...']
+    # — captures at the odd indices, texts at the even ones. Pairing the
+    # two slices replaces the index-juggling while loop, and int() cannot
+    # fail on a (\d+) capture so no try/except is needed.
+    parts = _verse_split(text)
+    return [
+        (int(num), stripped)
+        for num, verse_text in zip(parts[1::2], parts[2::2])
+        if (stripped := verse_text.strip())
+    ]
 
 
 def parse_verse_line(text: str) -> Optional[Tuple[str, int, int, str]]:
@@ -139,147 +140,295 @@ def parse_verse_line(text: str) -> Optional[Tuple[str, int, int, str]]:
 
 
 
-def convert_excel_to_csv(
-    excel_path: Path,
-    csv_path: Path,
-    verbose: bool = False
-) -> None:
+def _load_shared_strings(zf: zipfile.ZipFile) -> List[str]:
+    """Read xl/sharedStrings.xml into a list indexed by string id."""
+    if "xl/sharedStrings.xml" not in zf.namelist():
+        return []
+    shared: List[str] = []
+    with zf.open("xl/sharedStrings.xml") as fh:
+        for _, elem in ET.iterparse(fh):
+            if elem.tag.endswith("}si"):
+                shared.append(
+                    "".join(t.text or "" for t in elem.iter() if t.tag.endswith("}t"))
+                )
+                elem.clear()
+    return shared
+
+
+def _cell_str(cell: ET.Element, shared: List[str]) -> Optional[str]:
+    """Decode one <c> element to its string value, or None if not a string cell."""
+    t = cell.get("t")
+    if t == "inlineStr":
+        return "".join(n.text or "" for n in cell.iter() if n.tag.endswith("}t"))
+    for child in cell:
+        if child.tag.endswith("}v"):
+            if t == "s":
+                return shared[int(child.text)]
+            if t == "str":
+                return child.text or ""
+            return None  # numeric/boolean cell
+    return None
+
+
+def _open_text_column_stream(excel_path: Path) -> Iterator[str]:
     """
-    Convert single Excel file from (Page, Line, Text) to (book, chapter, verse, text).
-    
-    This parser is stateful:
+    Stream the Text column straight from the .xlsx zip.
+
+    openpyxl builds a ReadOnlyCell object per cell even in read-only
+    mode; iterparse on the raw sheet XML skips all of that and only
+    decodes the one column we need. The shared-strings table is loaded
+    eagerly, the first sheet row is consumed to locate the Text column,
+    and a generator over the remaining rows is returned.
+
+    Anything structurally unexpected (not a zip, no sheet1.xml, no Text
+    header) raises here, before any rows are yielded, so the caller can
+    fall back to the openpyxl path.
+    """
+    zf = zipfile.ZipFile(excel_path)
+    try:
+        shared = _load_shared_strings(zf)
+        fh = zf.open("xl/worksheets/sheet1.xml")
+        events = ET.iterparse(fh)
+        col_letter = None
+        for _, elem in events:
+            if elem.tag.endswith("}row"):
+                for c in elem:
+                    if _cell_str(c, shared) == "Text":
+                        col_letter = c.get("r", "").rstrip("0123456789")
+                        break
+                elem.clear()
+                break
+        if not col_letter:
+            raise ValueError(f"No 'Text' column in first row of {excel_path.name}")
+    except BaseException:
+        zf.close()
+        raise
+
+    def _rows() -> Iterator[str]:
+        try:
+            for _, elem in events:
+                if elem.tag.endswith("}row"):
+                    for c in elem:
+                        if c.get("r", "").rstrip("0123456789") == col_letter:
+                            value = _cell_str(c, shared)
+                            if value is not None:
+                                yield value
+                    elem.clear()
+        finally:
+            zf.close()
+
+    return _rows()
+
+
+def _iter_verses(
+    text_rows: Iterator[Optional[str]], verbose: bool = False
+) -> Iterator[Tuple[str, int, int, str]]:
+    """
+    Run the stateful verse parser over a stream of Text-column values,
+    yielding (book, chapter, verse, text) tuples as they complete.
+
+    State:
     1. Tracks current book/chapter from headers like "Genesis 1"
     2. Splits text by inline verse numbers (e.g., "1In...2And...")
     3. Accumulates verse text across multiple rows
     """
-    print(f"[info] Converting {excel_path.name}...")
-    
-    wb = openpyxl.load_workbook(excel_path, read_only=True)
-    ws = wb.active
-    
-    # Find Text column
-    header = [cell.value for cell in ws[1]]
-    try:
-        text_col_idx = header.index("Text")
-    except ValueError:
-        print(f"[warn] No 'Text' column in {excel_path.name}, skipping")
-        wb.close()
-        return
-    
-    verses = []
     current_book = None
     current_chapter = None
-    pending_verse_text = []  # Accumulate text for current verse
+    # Accumulate text for the current verse. A verse rarely spans more
+    # than a couple of rows, so a plain string with += (in-place
+    # growth in CPython) beats a fragment list plus a join per verse.
+    # Book names need no interning: normalize_book_name hands back the
+    # one canonical string object from _CANON, so every row of a book
+    # already shares it.
+    pending_verse_text = ""
     pending_verse_num = None
-    
-    for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
-        if not row or len(row) <= text_col_idx:
-            continue
-        
-        text = row[text_col_idx]
+
+    # Local bindings: LOAD_FAST instead of a global lookup per row.
+    _parse_header = parse_book_chapter_header
+    _split_verses = split_verses
+
+    for text in text_rows:
         if not text or not isinstance(text, str):
             continue
-        
+
         text = text.strip()
-        
+
         # Check if this is a book/chapter header
-        header_match = parse_book_chapter_header(text)
+        header_match = _parse_header(text)
         if header_match:
-            # Save any pending verse
+            # Flush any pending verse
             if current_book and current_chapter and pending_verse_num:
-                verses.append((
-                    current_book,
-                    current_chapter,
-                    pending_verse_num,
-                    " ".join(pending_verse_text)
-                ))
-                pending_verse_text = []
+                yield (current_book, current_chapter, pending_verse_num, pending_verse_text)
+                pending_verse_text = ""
                 pending_verse_num = None
-            
+
             current_book, current_chapter = header_match
             if verbose:
                 print(f"  ...found {current_book} {current_chapter}")
             continue
-        
+
         # Skip if we haven't found a book/chapter yet
         if not current_book or not current_chapter:
             continue
-        
+
         # Try to extract verses from this line
-        extracted_verses = split_verses(text)
-        
+        extracted_verses = _split_verses(text)
+
         if extracted_verses:
-            # Save any pending verse from previous line
-            if pending_verse_num:
-                verses.append((
-                    current_book,
-                    current_chapter,
-                    pending_verse_num,
-                    " ".join(pending_verse_text)
-                ))
-                pending_verse_text = []
-            
-            # Add new verses (except possibly the last one which might continue)
-            for i, (v_num, v_text) in enumerate(extracted_verses):
-                if i < len(extracted_verses) - 1:
-                    # Complete verse
-                    verses.append((current_book, current_chapter, v_num, v_text))
-                else:
-                    # Last verse might continue on next line
-                    pending_verse_num = v_num
-                    pending_verse_text = [v_text]
-            
-            if verbose and len(verses) % 1000 == 0:
-                print(f"  ...parsed {len(verses)} verses")
+            # Each verse becomes pending in turn, flushing its
+            # predecessor. No last-element special case: the final verse
+            # simply stays pending in case the next row continues it,
+            # and this same flush covers any verse pending from the
+            # previous line.
+            for v_num, v_text in extracted_verses:
+                if pending_verse_num:
+                    yield (current_book, current_chapter, pending_verse_num, pending_verse_text)
+                pending_verse_num = v_num
+                pending_verse_text = v_text
         else:
             # No verse markers, might be continuation of previous verse
             if pending_verse_num:
-                pending_verse_text.append(text)
-    
-    # Save final pending verse
+                pending_verse_text += " " + text
+
+    # Flush final pending verse
     if current_book and current_chapter and pending_verse_num:
-        verses.append((
-            current_book,
-            current_chapter,
-            pending_verse_num,
-            " ".join(pending_verse_text)
-        ))
-    
-    wb.close()
-    
-    # Write CSV
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
-    with csv_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["book", "chapter", "verse", "text"])
-        writer.writerows(verses)
-    
-    print(f"[ok] Converted {len(verses)} verses to {csv_path.name}")
+        yield (current_book, current_chapter, pending_verse_num, pending_verse_text)
 
 
+def convert_excel_to_csv(
+    excel_path: Path,
+    csv_path: Path,
+    verbose: bool = False
+) -> None:
+    """
+    Convert single Excel file from (Page, Line, Text) to (book, chapter, verse, text).
+
+    Parsing lives in _iter_verses; this function wires the Text-column
+    stream into it and streams the resulting tuples to the CSV writer.
+    """
+    print(f"[info] Converting {excel_path.name}...")
+
+    # Prefer streaming the sheet XML directly (no per-cell openpyxl
+    # objects); fall back to openpyxl for anything the raw reader
+    # doesn't recognize.
+    wb = None
+    try:
+        text_rows: Iterator[Optional[str]] = _open_text_column_stream(excel_path)
+    except Exception:
+        # data_only skips formula bookkeeping and keep_links skips external
+        # link resolution; neither feature appears in extracted workbooks.
+        wb = openpyxl.load_workbook(
+            excel_path, read_only=True, data_only=True, keep_links=False
+        )
+        ws = wb.active
+
+        # Find Text column
+        header = [cell.value for cell in ws[1]]
+        try:
+            text_col_idx = header.index("Text")
+        except ValueError:
+            print(f"[warn] No 'Text' column in {excel_path.name}, skipping")
+            wb.close()
+            return
+
+        # Only the Text column is ever read, so restrict iteration to that
+        # one column: openpyxl materializes a single value per row instead
+        # of the whole (Page, Line, Text) tuple.
+        text_col = text_col_idx + 1
+        text_rows = (
+            text
+            for (text,) in ws.iter_rows(
+                min_row=2, min_col=text_col, max_col=text_col, values_only=True
+            )
+        )
+
+    # Stream parsed verses straight into the csv writer: no list of the
+    # whole sheet is held, so peak memory stays flat and disk writes
+    # interleave with parsing. The counting wrapper exists only for the
+    # progress/summary prints.
+    verse_count = 0
+
+    def _counted(rows: Iterator[Tuple[str, int, int, str]]) -> Iterator[Tuple[str, int, int, str]]:
+        nonlocal verse_count
+        for row in rows:
+            verse_count += 1
+            if verbose and verse_count % 1000 == 0:
+                print(f"  ...parsed {verse_count} verses")
+            yield row
+
+    try:
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        with csv_path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["book", "chapter", "verse", "text"])
+            writer.writerows(_counted(_iter_verses(text_rows, verbose)))
+    finally:
+        if wb is not None:
+            wb.close()
+
+    print(f"[ok] Converted {verse_count} verses to {csv_path.name}")
+
+
+
+def _convert_one(
+    excel_path: Path, csv_path: Path, verbose: bool
+) -> Tuple[Path, Optional[str]]:
+    """
+    Picklable worker wrapper for batch mode.
+
+    Returns (excel_path, error message or None) so the parent can report
+    failures without a traceback killing the whole batch.
+    """
+    try:
+        convert_excel_to_csv(excel_path, csv_path, verbose)
+        return excel_path, None
+    except Exception as e:
+        return excel_path, str(e)
+
 
 def batch_convert(
     input_dir: Path,
     output_dir: Path,
-    verbose: bool = False
+    verbose: bool = False,
+    workers: Optional[int] = None
 ) -> None:
     """
     Convert all .xlsx files in input_dir to CSV in output_dir.
+
+    Each file is independent, so with workers > 1 the conversions are
+    spread over a process pool (default: one worker per CPU core).
     """
-    excel_files = list(input_dir.glob("*.xlsx"))
-    
+    excel_files = sorted(input_dir.glob("*.xlsx"))
+
     if not excel_files:
         print(f"[warn] No .xlsx files found in {input_dir}")
         return
-    
+
     print(f"[info] Found {len(excel_files)} Excel files")
-    
-    for excel_path in sorted(excel_files):
-        csv_path = output_dir / excel_path.with_suffix(".csv").name
-        try:
-            convert_excel_to_csv(excel_path, csv_path, verbose)
-        except Exception as e:
-            print(f"[error] Failed to convert {excel_path.name}: {e}")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(excel_files))
+
+    if workers <= 1:
+        for excel_path in excel_files:
+            csv_path = output_dir / excel_path.with_suffix(".csv").name
+            try:
+                convert_excel_to_csv(excel_path, csv_path, verbose)
+            except Exception as e:
+                print(f"[error] Failed to convert {excel_path.name}: {e}")
+        return
+
+    print(f"[info] Workers: {workers}")
+    csv_paths = [output_dir / p.with_suffix(".csv").name for p in excel_files]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map keeps input order, so failure reporting stays deterministic
+        # even though the per-file [info]/[ok] lines may interleave.
+        for excel_path, err in executor.map(
+            _convert_one, excel_files, csv_paths, repeat(verbose)
+        ):
+            if err:
+                print(f"[error] Failed to convert {excel_path.name}: {err}")
 
 
 def main(argv=None):
@@ -311,15 +460,21 @@ def main(argv=None):
         action="store_true",
         help="Verbose output"
     )
-    
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=None,
+        help="Parallel worker processes for batch mode (default: one per CPU core)"
+    )
+
     args = parser.parse_args(argv)
-    
+
     if args.input and args.output:
         # Single file mode
         convert_excel_to_csv(args.input, args.output, args.verbose)
     elif args.batch and args.outdir:
         # Batch mode
-        batch_convert(args.batch, args.outdir, args.verbose)
+        batch_convert(args.batch, args.outdir, args.verbose, args.workers)
     else:
         parser.print_help()
         sys.exit(1)
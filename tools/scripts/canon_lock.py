@@ -18,8 +18,14 @@ LOCK_FILE = Path("CANON/CANON_LOCK.md")
 
 
 def sha256(p: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    return hashlib.sha256(p.read_bytes()).hexdigest()
+    """Compute SHA256 hash of a file without reading it whole into memory."""
+    with p.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
 
 
 def main() -> None:
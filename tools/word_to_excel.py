@@ -6,7 +6,10 @@ Extracts text content and tables from PDF files and writes to .xlsx format.
 Optimized for large documents with batch processing and progress tracking.
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 
@@ -19,22 +22,46 @@ except ImportError:
     sys.exit(1)
 
 
+def _extract_page_text_range(pdf_path_str: str, first: int, last: int):
+    """Picklable worker: extract text for pages first..last (1-based, inclusive).
+
+    Opens its own pdfplumber handle — page objects and the underlying
+    pdfminer document are not safe to share across workers. Returns a
+    list of (page_num, text-or-None) in page order.
+    """
+    results = []
+    with pdfplumber.open(pdf_path_str) as pdf:
+        for idx in range(first - 1, last):
+            page = pdf.pages[idx]
+            try:
+                text = page.extract_text()
+            except Exception:
+                text = None
+            results.append((idx + 1, text))
+            page.flush_cache()
+    return results
+
+
 def convert_pdf_to_excel(
     pdf_path: str,
     excel_path: Optional[str] = None,
     mode: str = "text",
     batch_size: int = 50,
-    save_every: int = 500
+    save_every: int = 500,
+    workers: Optional[int] = None
 ) -> None:
     """
     Convert PDF document to Excel spreadsheet.
-    
+
     Args:
         pdf_path: Path to input .pdf file
         excel_path: Path to output .xlsx file (defaults to same name)
         mode: Extraction mode - "text" (text by page/line) or "tables" (extract tables)
         batch_size: Number of pages to process before progress update
-        save_every: Save workbook every N pages to prevent memory issues
+        save_every: Accepted for compatibility; ignored. The write-only
+            workbook streams rows to disk and saves once at the end.
+        workers: Worker processes for text-mode page extraction
+            (default: one per CPU core; tables mode stays sequential)
     """
     pdf_file = Path(pdf_path)
     if not pdf_file.exists():
@@ -55,88 +82,122 @@ def convert_pdf_to_excel(
     file_size_mb = pdf_file.stat().st_size / (1024 * 1024)
     print(f"[info] Reading PDF document: {pdf_file.name} ({file_size_mb:.2f} MB)")
     
-    # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    
+    # Create workbook. write_only streams each appended row straight to
+    # the zip rather than building an in-memory Cell per value, and
+    # wb.save runs exactly once — the old periodic save rewrote the
+    # whole workbook every save_every pages.
+    wb = Workbook(write_only=True)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
     try:
-        with pdfplumber.open(pdf_file) as pdf:
-            total_pages = len(pdf.pages)
-            print(f"[info] Document contains {total_pages} pages")
-            
-            if mode == "text":
-                # Extract text line by line
-                ws.title = "Text Content"
-                ws.append(["Page", "Line", "Text"])
-                row_count = 0
-                
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    text = page.extract_text()
-                    if text:
-                        lines = text.split('\n')
-                        for line_num, line in enumerate(lines, start=1):
-                            line = line.strip()
-                            if line:  # Skip empty lines
-                                ws.append([page_num, line_num, line])
-                                row_count += 1
-                    
-                    # Progress update
-                    if page_num % batch_size == 0:
-                        progress = (page_num / total_pages) * 100
-                        print(f"[info] Processing... Page {page_num}/{total_pages} ({progress:.1f}%) - {row_count:,} lines extracted")
-                    
-                    # Periodic save to prevent memory issues with large files
-                    if page_num % save_every == 0:
-                        print(f"[info] Auto-saving at page {page_num}...")
-                        wb.save(excel_path)
-                
-                print(f"[ok] Extracted {row_count:,} lines from {total_pages} pages")
-            
-            elif mode == "tables":
+        if mode == "text":
+            # Extract text line by line
+            ws = wb.create_sheet("Text Content")
+            append = ws.append  # hoist the attribute lookup out of the hot loop
+            append(["Page", "Line", "Text"])
+            row_count = 0
+            page_num = 0
+
+            def _emit_page(page_num, text):
+                nonlocal row_count
+                if text:
+                    # map/filter in the comprehension keeps the
+                    # strip-and-skip pass in C; line numbers still
+                    # count raw lines, blanks included, as before.
+                    page_rows = [
+                        (page_num, line_num, line)
+                        for line_num, line in enumerate(
+                            map(str.strip, text.split('\n')), start=1
+                        )
+                        if line  # Skip empty lines
+                    ]
+                    for row in page_rows:
+                        append(row)
+                    row_count += len(page_rows)
+
+                # Progress update
+                if page_num % batch_size == 0:
+                    print(f"[info] Processing... Page {page_num} - {row_count:,} lines extracted")
+
+            if workers > 1:
+                # Extraction dominates the runtime and pdfminer is pure
+                # Python (the GIL never drops), so pages are sharded into
+                # contiguous ranges across worker processes — same scheme
+                # as convert_single_pdf_retry. map() preserves submission
+                # order, so rows land in page order.
+                with pdfplumber.open(pdf_file) as pdf:
+                    total_pages = len(pdf.pages)
+                workers = min(workers, total_pages)
+                print(f"[info] Workers: {workers}")
+                step = -(-total_pages // workers)
+                firsts = list(range(1, total_pages + 1, step))
+                lasts = [min(f + step - 1, total_pages) for f in firsts]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for pages in executor.map(
+                        _extract_page_text_range, repeat(str(pdf_file)), firsts, lasts
+                    ):
+                        for page_num, text in pages:
+                            _emit_page(page_num, text)
+            else:
+                # Lazy iteration: no up-front len(pdf.pages), which would
+                # materialize the whole page tree just to print a
+                # denominator the loop doesn't need.
+                with pdfplumber.open(pdf_file) as pdf:
+                    for page_num, page in enumerate(pdf.pages, start=1):
+                        _emit_page(page_num, page.extract_text())
+                        page.flush_cache()
+
+            print(f"[ok] Extracted {row_count:,} lines from {page_num} pages")
+
+        elif mode == "tables":
+            # Tables output is small; keep this mode sequential.
+            with pdfplumber.open(pdf_file) as pdf:
                 # Extract tables from all pages
-                ws.title = "Tables"
+                ws = wb.create_sheet("Tables")
+                append = ws.append  # hoist the attribute lookup out of the hot loop
                 table_count = 0
                 total_rows = 0
-                
+
                 for page_num, page in enumerate(pdf.pages, start=1):
                     tables = page.extract_tables()
-                    
+
                     if tables:
                         for table_idx, table in enumerate(tables):
                             table_count += 1
-                            
+
                             # Add separator between tables
                             if table_count > 1:
-                                ws.append([])  # Empty row
-                            
+                                append([])  # Empty row
+
                             # Add table header with page/table info
-                            ws.append([f"Page {page_num} - Table {table_idx + 1}"])
-                            
+                            append([f"Page {page_num} - Table {table_idx + 1}"])
+
                             # Add table data
                             for row in table:
                                 if row:  # Skip None rows
                                     # Clean cells (handle None values)
                                     cleaned_row = [str(cell).strip() if cell else "" for cell in row]
-                                    ws.append(cleaned_row)
+                                    append(cleaned_row)
                                     total_rows += 1
                         
                         print(f"[info] Page {page_num}: Found {len(tables)} table(s)")
                     
                     # Progress update
                     if page_num % batch_size == 0:
-                        progress = (page_num / total_pages) * 100
-                        print(f"[info] Processing... Page {page_num}/{total_pages} ({progress:.1f}%)")
+                        print(f"[info] Processing... Page {page_num}")
                 
                 if table_count == 0:
                     print("[warn] No tables found in document")
                     ws.append(["No tables found"])
                 else:
                     print(f"[ok] Extracted {table_count} tables with {total_rows:,} total rows")
-            
-            else:
-                print(f"[error] Unknown mode: {mode}. Use 'text' or 'tables'")
-                sys.exit(1)
-    
+
+        else:
+            print(f"[error] Unknown mode: {mode}. Use 'text' or 'tables'")
+            sys.exit(1)
+
     except Exception as e:
         print(f"[error] Failed to process PDF: {e}")
         sys.exit(1)
@@ -180,17 +241,24 @@ def main(argv: list[str]) -> None:
         "-s", "--save-every",
         type=int,
         default=500,
-        help="Auto-save every N pages to manage memory (default: 500 pages)"
+        help="Ignored; kept for compatibility. Rows stream to disk and the file is saved once at the end."
     )
-    
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=None,
+        help="Parallel worker processes for text-mode page extraction (default: one per CPU core)"
+    )
+
     args = parser.parse_args(argv)
-    
+
     convert_pdf_to_excel(
         pdf_path=args.pdf_file,
         excel_path=args.output,
         mode=args.mode,
         batch_size=args.batch_size,
-        save_every=args.save_every
+        save_every=args.save_every,
+        workers=args.workers
     )
 
 